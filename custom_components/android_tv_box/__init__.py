@@ -1,6 +1,7 @@
 """Android TV Box integration for Home Assistant."""
 import asyncio
 import logging
+import random
 from typing import Dict, Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -12,6 +13,10 @@ from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
 
+# Backoff between WiFi recovery attempts while the network stays down
+WIFI_RECOVERY_BACKOFF = 60
+WIFI_RECOVERY_BACKOFF_MAX = 1800
+
 PLATFORMS = [
     Platform.MEDIA_PLAYER,
     Platform.SWITCH,
@@ -82,7 +87,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not adb:
             return
         consecutive_down = 0
+        recovery_attempts = 0
+        next_recovery = 0.0
+        # Checks run on a fixed 15s cadence regardless of how long each one takes
+        next_check = hass.loop.time()
         while True:
+            next_check += 15
             try:
                 # Consider WiFi down if disabled or SSID/IP unknown
                 wifi_on = await adb.is_wifi_on()
@@ -92,22 +102,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 wifi_connected = bool(wifi_on and ssid and ssid != "Unknown" and ip and ip != "Unknown")
                 if wifi_connected:
                     consecutive_down = 0
+                    recovery_attempts = 0
                 else:
                     consecutive_down += 1
                     # 60s window with 15s checks => 4 consecutive misses
-                    if consecutive_down >= 4:
+                    if consecutive_down >= 4 and hass.loop.time() >= next_recovery:
                         _LOGGER.warning("WiFi appears down for ~60s. Attempting recovery: enable WiFi, then reboot if needed.")
-                        # First try enabling WiFi explicitly
+                        # First try enabling WiFi explicitly (wifi_on also runs "svc wifi enable")
                         try:
                             await adb.wifi_on()
-                            await adb.shell_command("svc wifi enable")
                         except Exception:
                             pass
                         await asyncio.sleep(10)
-                        # Re-check; if still down, reboot device
+                        # Re-check on the device itself; a cached read may predate recovery
                         try:
-                            wifi_on2 = await adb.is_wifi_on()
-                            info2 = await adb.get_wifi_info()
+                            wifi_on2 = await adb.is_wifi_on(fresh=True)
+                            info2 = await adb.get_wifi_info(fresh=True)
                             if not (wifi_on2 and (info2.get("ssid") not in (None, "Unknown"))):
                                 _LOGGER.warning("WiFi recovery failed, rebooting Android device...")
                                 await adb.reboot_device()
@@ -120,12 +130,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                             _LOGGER.error(f"WiFi recovery error: {e}")
                         finally:
                             consecutive_down = 0
-                await asyncio.sleep(15)
+                            # Back off exponentially with jitter so a persistent outage
+                            # doesn't trigger a reboot every minute
+                            recovery_attempts += 1
+                            backoff = min(
+                                WIFI_RECOVERY_BACKOFF * 2 ** (recovery_attempts - 1),
+                                WIFI_RECOVERY_BACKOFF_MAX,
+                            )
+                            next_recovery = hass.loop.time() + backoff * random.uniform(0.5, 1.5)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 _LOGGER.debug(f"WiFi monitor iteration error: {e}")
-                await asyncio.sleep(15)
+            now = hass.loop.time()
+            if next_check < now:
+                # A recovery overran the slot; resume the cadence from here
+                next_check = now
+            try:
+                await asyncio.sleep(next_check - now)
+            except asyncio.CancelledError:
+                break
 
     wifi_task = hass.loop.create_task(_wifi_monitor())
     hass.data[DOMAIN].setdefault("tasks", []).append(wifi_task)
@@ -140,12 +164,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Cancel background tasks
-        for task in hass.data.get(DOMAIN, {}).get("tasks", []):
-            try:
-                task.cancel()
-            except Exception:
-                pass
+        # Cancel background tasks and wait for them to finish unwinding, so no
+        # adb command they started outlives the entry
+        tasks = hass.data.get(DOMAIN, {}).get("tasks", [])
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
         hass.data[DOMAIN].pop("tasks", None)
         # Stop web server
         if DOMAIN in hass.data and "web_server" in hass.data[DOMAIN]:
@@ -1,19 +1,280 @@
 """ADB connection service for Android TV Box integration."""
 import asyncio
+import functools
 import logging
+import os
+import re
+import shlex
+import shutil
+import signal
 import subprocess
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, NamedTuple, Set, Tuple
 from datetime import datetime, timedelta
 
 _LOGGER = logging.getLogger(__name__)
 
+ADB_SERVER_HOST = "127.0.0.1"
+ADB_SERVER_PORT = 5037
+
+ISG_PACKAGE = "com.linknlink.app.device.isg"
+
+_PACKAGE_NAME_RE = re.compile(r"^[A-Za-z0-9._]+$")
+# package/activity component names in dumpsys activity output
+_COMPONENT_RE = re.compile(r'([a-zA-Z0-9_.]+)/[a-zA-Z0-9_.]+')
+
+# Fields of Android top output
+_TOP_CPU_RE = re.compile(r'(\d+)%cpu\s.*?(\d+)%user\s.*?(\d+)%sys', re.I)
+_TOP_MEM_RE = re.compile(r'Mem:\s*(\d+)K total,\s*(\d+)K used')
+_TOP_ROW_RE = re.compile(
+    r'^[ \t]*(\d+)[ \t]+\S+(?:[ \t]+\S+){6}[ \t]+(\d+(?:\.\d+)?)[ \t]+\d+(?:\.\d+)?[ \t]+\S+[ \t]+(?:.*[ \t])?(\S+)[ \t]*$',
+    re.M,
+)
+# top sorts by CPU, so only the busiest rows are ever needed
+_TOP_MAX_ROWS = 16
+_ANSI_ESCAPE_RE = re.compile(r'\x1B\[[0-9;]*[A-Za-z]')
+
+_WIFI_SECTION_MARKER = "__ADB_WIFI_IP__"
+_PROC_SECTION_MARKER = "__ADB_PROC_PIDS__"
+_SERVICE_NAME_CACHE_SIZE = 512
+# The kernel truncates /proc/<pid>/stat comm to this many characters
+_COMM_MAX_LEN = 15
+# Seconds between running-state probes in wait_for_package
+_PACKAGE_POLL_INTERVAL = 0.25
+# Seconds between the two /proc samples taken when there is no baseline yet
+_PROC_BASELINE_WINDOW = 0.5
+# Only the cpu rows of /proc/stat and these /proc/meminfo fields are used
+_PROC_SYSTEM_FIELDS = "^(cpu|MemTotal:|MemFree:)"
+_MEMINFO_RE = re.compile(r'^(MemTotal|MemFree):\s+(\d+)', re.M)
+_SSID_RE = re.compile(r'"([^"]+)"')
+_INET_RE = re.compile(r'inet (\d+\.\d+\.\d+\.\d+)')
+
+# PlaybackState formats seen in dumpsys media_session
+_PLAYBACK_SYM_PAREN_RE = re.compile(r"state=([A-Z_]+)\((\d+)\)")
+_PLAYBACK_SYM_STATE_RE = re.compile(r"state=STATE_([A-Z_]+)")
+_PLAYBACK_SYM_PLAIN_RE = re.compile(r"PlaybackState\s*\{\s*state=([A-Z_]+)\b")
+_PLAYBACK_NUM_RE = re.compile(r"state=(\d+)")
+
+# How long each device read may be served from cache, in seconds. Volatile
+# state expires quickly; slow-changing state is shared across coordinators longer.
+_READ_TTLS = MappingProxyType({
+    "current_app": 2.0,
+    "powered_on": 2.0,
+    "volume": 2.0,
+    "brightness": 5.0,
+    "wifi_on": 5.0,
+    "wifi_info": 10.0,
+})
+
+
+def _ttl_cached(key: str):
+    """Serve a device read from the per-entry read cache while it is fresh.
+
+    Pass ``fresh=True`` to bypass the cache and always query the device.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, fresh: bool = False):
+            now = time.monotonic()
+            entry = self._read_cache.get(key)
+            if not fresh and entry is not None and now - entry[0] < _READ_TTLS[key]:
+                value = entry[1]
+            else:
+                generation = self._read_generations.get(key, 0)
+                value = await func(self)
+                # A command invalidated this key mid-read; the value may predate it
+                if self._read_generations.get(key, 0) == generation:
+                    self._read_cache[key] = (now, value)
+            return dict(value) if isinstance(value, dict) else value
+        return wrapper
+    return decorator
+
+
+def _invalidates(*keys: str):
+    """Drop the given cached reads once a state-changing command has run."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                self._invalidate_reads(*keys)
+        return wrapper
+    return decorator
+
+
+# Read-only template for get_system_performance results
+_DEFAULT_PERFORMANCE = MappingProxyType({
+    "cpu_usage_percent": 0.0,
+    "memory_usage_percent": 0.0,
+    "memory_total_mb": 0,
+    "memory_used_mb": 0,
+    "highest_cpu_process": None,
+    "highest_cpu_pid": None,
+    "highest_cpu_percent": 0.0,
+    "highest_cpu_service": None,
+})
+
+
+class _ProcSample(NamedTuple):
+    """One reading of the device's /proc counters, in clock ticks."""
+
+    total: int
+    idle: int
+    cores: int
+    memory: Dict[str, int]
+    # pid -> (comm, utime + stime, starttime)
+    processes: Dict[str, Tuple[str, int, int]]
+
 
 class ADBConnectionError(Exception):
     """Exception raised for ADB connection errors."""
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_adb_path(adb_path: str) -> str:
+    """Resolve the adb binary once, searching PATH when the configured path is missing."""
+    if os.path.isfile(adb_path) and os.access(adb_path, os.X_OK):
+        return adb_path
+    found = shutil.which(adb_path) or shutil.which(os.path.basename(adb_path)) or shutil.which("adb")
+    if found and found != adb_path:
+        _LOGGER.info(f"Using adb at {found} (configured: {adb_path})")
+    return found or adb_path
+
+
+async def _adb_server_request(services: List[str], timeout: float) -> bytes:
+    """Send services to the local adb server over its socket and read the reply.
+
+    Every service but the last must be answered with OKAY; the reply to the
+    last one is read until the server closes the connection.
+    """
+    async def exchange() -> bytes:
+        reader, writer = await asyncio.open_connection(ADB_SERVER_HOST, ADB_SERVER_PORT)
+        try:
+            for service in services:
+                payload = service.encode('utf-8')
+                writer.write(b"%04x" % len(payload) + payload)
+                await writer.drain()
+                status = await reader.readexactly(4)
+                if status != b"OKAY":
+                    length = int(await reader.readexactly(4), 16)
+                    message = (await reader.readexactly(length)).decode('utf-8', errors='ignore')
+                    raise ADBConnectionError(f"ADB server refused {service}: {message}")
+            return await reader.read()
+        finally:
+            writer.close()
+
+    return await asyncio.wait_for(exchange(), timeout=timeout)
+
+
+async def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill a child started with start_new_session=True, its process group and reap it."""
+    if process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+class _ShellSession:
+    """A long-lived ``adb shell`` process that runs commands fed over stdin.
+
+    Each command is followed by a unique end marker carrying its exit code,
+    which frames the output on stdout without spawning a new adb process.
+    """
+
+    def __init__(self):
+        """Initialize shell session."""
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._argv: List[str] = []
+        self._lock = asyncio.Lock()
+        self._counter = 0
+
+    @property
+    def busy(self) -> bool:
+        """Return True if a command is currently running in the session."""
+        return self._lock.locked()
+
+    async def run(self, argv: List[str], command: str, timeout: int) -> str:
+        """Run a command in the session started with argv."""
+        async with self._lock:
+            if self._process is None or self._process.returncode is not None or argv != self._argv:
+                await self._close()
+                self._process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    # Own process group, so a wedged session can be killed as a whole
+                    start_new_session=True
+                )
+                self._argv = argv
+
+            self._counter += 1
+            marker = f"__ADB_END_{self._counter}__"
+            script = f"sh -c {shlex.quote(command)} </dev/null 2>/dev/null; printf '\\n{marker} %d\\n' $?\n"
+            try:
+                self._process.stdin.write(script.encode('utf-8'))
+                await self._process.stdin.drain()
+                output, returncode = await asyncio.wait_for(self._read_until(marker), timeout=timeout)
+            except asyncio.TimeoutError:
+                await self._close()
+                raise subprocess.TimeoutExpired(command, timeout)
+            except (Exception, asyncio.CancelledError):
+                # The stream may hold a partial reply; never reuse it
+                await self._close()
+                raise
+
+            if returncode != 0:
+                _LOGGER.debug("Shell command exited with %s: %s", returncode, command)
+                raise ADBConnectionError(f"Command failed with exit code {returncode}")
+            return output
+
+    async def _read_until(self, marker: str) -> tuple:
+        """Read output until the end marker and return (output, exit code).
+
+        Output is read in large chunks rather than by line, so long lines
+        can't trip the stream reader's line length limit.
+        """
+        needle = f"\n{marker} ".encode('utf-8')
+        buffer = bytearray()
+        start = 0
+        while True:
+            chunk = await self._process.stdout.read(65536)
+            if not chunk:
+                raise ADBConnectionError("ADB shell session closed")
+            buffer += chunk
+            index = buffer.find(needle, start)
+            if index != -1:
+                end = buffer.find(b"\n", index + len(needle))
+                if end != -1:
+                    returncode = int(buffer[index + len(needle):end].strip() or 0)
+                    # Keep the newline that preceded the marker, as line reads did
+                    return buffer[:index + 1].decode('utf-8', errors='ignore'), returncode
+            else:
+                # Resume the search where a split marker could begin
+                start = max(0, len(buffer) - len(needle))
+
+    async def close(self):
+        """Terminate the session process."""
+        async with self._lock:
+            await self._close()
+
+    async def _close(self):
+        """Terminate the session process without taking the lock."""
+        process, self._process = self._process, None
+        if process is not None:
+            await _kill_process_group(process)
+
+
 class ADBService:
     """Service for managing ADB connections and executing commands."""
 
@@ -21,18 +282,34 @@ class ADBService:
         """Initialize ADB service."""
         self.host = host
         self.port = port
-        self.adb_path = adb_path
+        self.adb_path = _resolve_adb_path(adb_path)
         self.device_address = f"{host}:{port}"
         self._connected = False
-        self._last_command_time = 0
+        self._last_command_time = float("-inf")
         self._command_delay = 0.1  # Minimum delay between commands
+        self._shell_session = _ShellSession()
+        self._has_pidof: Optional[bool] = None
+        self._ps_cache: Optional[Tuple[float, Set[str]]] = None
+        # (time populated, result) of the last is_connected query
+        self._connected_cache: Optional[Tuple[float, bool]] = None
+        self._connected_cache_ttl = 5.0
+        self._read_cache: Dict[str, Tuple[float, Any]] = {}
+        # Bumped on every invalidation so reads in flight don't store stale values
+        self._read_generations: Dict[str, int] = {}
+        self._performance_task: Optional[asyncio.Future] = None
+        self._proc_sample: Optional[_ProcSample] = None
+        # (pid, starttime) -> service name; a reused PID has a new start time and misses
+        self._service_names: "OrderedDict[Tuple[str, int], Optional[str]]" = OrderedDict()
 
     async def connect(self) -> bool:
         """Connect to ADB device."""
+        self._connected_cache = None
+        self._invalidate_reads()
         try:
             # Connect to device
             result = await self._run_command(["connect", self.device_address])
-            if "connected" in result.lower() or "already connected" in result.lower():
+            # Case-fold once; "connected" also covers "already connected"
+            if "connected" in result.lower():
                 self._connected = True
                 _LOGGER.info(f"Connected to Android device at {self.device_address}")
                 return True
@@ -45,21 +322,62 @@ class ADBService:
 
     async def disconnect(self):
         """Disconnect from ADB device."""
+        self._connected_cache = None
+        self._invalidate_reads()
         try:
+            await self._shell_session.close()
             await self._run_command(["disconnect", self.device_address])
             self._connected = False
             _LOGGER.info(f"Disconnected from {self.device_address}")
         except Exception as e:
             _LOGGER.error(f"Error disconnecting from ADB: {e}")
 
+    def _invalidate_reads(self, *keys: str) -> None:
+        """Drop cached device reads affected by a command; all of them if no keys are given."""
+        for key in keys or _READ_TTLS:
+            self._read_cache.pop(key, None)
+            self._read_generations[key] = self._read_generations.get(key, 0) + 1
+
     async def is_connected(self) -> bool:
-        """Check if device is connected."""
+        """Check if device is connected, reusing a result younger than the cache TTL."""
+        now = time.monotonic()
+        if self._connected_cache is not None and now - self._connected_cache[0] < self._connected_cache_ttl:
+            return self._connected_cache[1]
+
+        connected = await self._query_connected()
+        self._connected_cache = (now, connected)
+        return connected
+
+    async def _query_connected(self) -> bool:
+        """Ask the adb server whether the device is attached and online."""
+        try:
+            reply = await _adb_server_request(["host:devices"], timeout=5)
+            # The device list is prefixed with its hex length
+            return self._listed_online(reply[4:].decode('utf-8', errors='ignore'))
+        except asyncio.TimeoutError:
+            # TimeoutError is an OSError on 3.11+, so it must be caught first
+            return False
+        except (ConnectionRefusedError, FileNotFoundError):
+            # No local adb server socket; fall back to the CLI
+            pass
+        except Exception:
+            return False
+
         try:
             result = await self._run_command(["devices"])
-            return self.device_address in result and "device" in result
+            return self._listed_online(result)
         except Exception:
             return False
 
+    def _listed_online(self, listing: str) -> bool:
+        """Return True if a device listing shows this device in the "device" state."""
+        for line in listing.splitlines():
+            # "<serial>\t<state>"; the CLI adds a header line that never matches
+            parts = line.split(None, 2)
+            if len(parts) >= 2 and parts[0] == self.device_address:
+                return parts[1] == "device"
+        return False
+
     async def shell_command(self, command: str, timeout: int = 10) -> str:
         """Execute shell command on device."""
         if not self._connected:
@@ -67,15 +385,21 @@ class ADBService:
                 raise ADBConnectionError("Device not connected")
 
         # Add delay between commands to avoid overwhelming the device
-        current_time = time.time()
-        if current_time - self._last_command_time < self._command_delay:
-            await asyncio.sleep(self._command_delay - (current_time - self._last_command_time))
+        current_time = time.monotonic()
+        wait = self._command_delay - (current_time - self._last_command_time)
+        if wait > 0:
+            await asyncio.sleep(wait)
+            current_time += wait
         
-        self._last_command_time = time.time()
+        self._last_command_time = current_time
 
         try:
-            cmd = ["-s", self.device_address, "shell", "sh", "-c", command]
-            result = await self._run_command(cmd, timeout=timeout)
+            if self._shell_session.busy:
+                # The persistent shell is in use; run concurrent commands standalone
+                result = await self._shell_command_oneshot(command, timeout)
+            else:
+                argv = [self.adb_path, "-s", self.device_address, "shell"]
+                result = await self._shell_session.run(argv, command, timeout)
             return result.strip()
         except subprocess.TimeoutExpired:
             _LOGGER.error(f"ADB command timeout: {command}")
@@ -84,15 +408,41 @@ class ADBService:
             _LOGGER.error(f"ADB command error: {e}")
             raise ADBConnectionError(f"Command failed: {command}")
 
+    async def _shell_command_oneshot(self, command: str, timeout: int) -> str:
+        """Run a shell command on its own connection, via the adb server socket if possible."""
+        script = f"sh -c {shlex.quote(command)} </dev/null 2>/dev/null; printf '\\n%d' $?"
+        try:
+            reply = await _adb_server_request(
+                [f"host:transport:{self.device_address}", f"shell:{script}"], timeout
+            )
+        except asyncio.TimeoutError:
+            # TimeoutError is an OSError on 3.11+; the command may already have
+            # run on the device, so it must not be retried through the CLI
+            raise subprocess.TimeoutExpired(command, timeout)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # No local adb server socket; spawn the CLI instead
+            cmd = ["-s", self.device_address, "shell", "sh", "-c", command]
+            return await self._run_command(cmd, timeout=timeout)
+
+        output, _, status = reply.decode('utf-8', errors='ignore').rpartition('\n')
+        if status.strip() != "0":
+            _LOGGER.debug("Shell command exited with status %s: %s", status.strip(), command)
+            raise ADBConnectionError(f"Command exited with status {status.strip()}")
+        return output
+
     async def _run_command(self, cmd: List[str], timeout: int = 10) -> str:
         """Run ADB command."""
         full_cmd = [self.adb_path] + cmd
-        _LOGGER.debug(f"Running ADB command: {' '.join(full_cmd)}")
+        # Called for every command; skip building the message unless it is logged
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Running ADB command: %s", ' '.join(full_cmd))
         
         process = await asyncio.create_subprocess_exec(
             *full_cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            # Own process group, so a hung command can be killed with its children
+            start_new_session=True
         )
         
         try:
@@ -106,8 +456,12 @@ class ADBService:
             
             return result
         except asyncio.TimeoutError:
-            process.kill()
+            await _kill_process_group(process)
             raise subprocess.TimeoutExpired(full_cmd, timeout)
+        except asyncio.CancelledError:
+            # Don't leave the adb client running behind a cancelled caller
+            await asyncio.shield(_kill_process_group(process))
+            raise
 
     async def pull_file(self, remote_path: str, local_path: str) -> bool:
         """Pull a file from the device to the local filesystem."""
@@ -179,6 +533,7 @@ class ADBService:
             return False
 
     # Volume Commands
+    @_invalidates("volume")
     async def volume_up(self) -> bool:
         """Increase volume."""
         try:
@@ -188,6 +543,7 @@ class ADBService:
             _LOGGER.error(f"Volume up failed: {e}")
             return False
 
+    @_invalidates("volume")
     async def volume_down(self) -> bool:
         """Decrease volume."""
         try:
@@ -197,6 +553,7 @@ class ADBService:
             _LOGGER.error(f"Volume down failed: {e}")
             return False
 
+    @_invalidates("volume")
     async def volume_mute(self) -> bool:
         """Toggle mute."""
         try:
@@ -206,6 +563,7 @@ class ADBService:
             _LOGGER.error(f"Volume mute failed: {e}")
             return False
 
+    @_invalidates("volume")
     async def set_volume(self, volume: int) -> bool:
         """Set volume level (0-100)."""
         try:
@@ -217,6 +575,7 @@ class ADBService:
             _LOGGER.error(f"Set volume failed: {e}")
             return False
 
+    @_ttl_cached("volume")
     async def get_volume(self) -> Optional[int]:
         """Get current volume level."""
         try:
@@ -233,6 +592,7 @@ class ADBService:
             return None
 
     # Power Commands
+    @_invalidates("powered_on", "current_app")
     async def power_on(self) -> bool:
         """Wake up device."""
         try:
@@ -242,6 +602,7 @@ class ADBService:
             _LOGGER.error(f"Power on failed: {e}")
             return False
 
+    @_invalidates("powered_on", "current_app")
     async def power_off(self) -> bool:
         """Put device to sleep."""
         try:
@@ -251,6 +612,7 @@ class ADBService:
             _LOGGER.error(f"Power off failed: {e}")
             return False
 
+    @_ttl_cached("powered_on")
     async def is_powered_on(self) -> bool:
         """Check if device is powered on."""
         try:
@@ -261,6 +623,7 @@ class ADBService:
             return False
 
     # WiFi Commands
+    @_invalidates("wifi_on", "wifi_info")
     async def wifi_on(self) -> bool:
         """Enable WiFi."""
         try:
@@ -275,6 +638,7 @@ class ADBService:
             _LOGGER.error(f"WiFi on failed: {e}")
             return False
 
+    @_invalidates("wifi_on", "wifi_info")
     async def wifi_off(self) -> bool:
         """Disable WiFi."""
         try:
@@ -284,6 +648,7 @@ class ADBService:
             _LOGGER.error(f"WiFi off failed: {e}")
             return False
 
+    @_ttl_cached("wifi_on")
     async def is_wifi_on(self) -> bool:
         """Check if WiFi is enabled."""
         try:
@@ -330,6 +695,7 @@ class ADBService:
             _LOGGER.error(f"Key right failed: {e}")
             return False
 
+    @_invalidates("current_app")
     async def key_enter(self) -> bool:
         """Send enter key."""
         try:
@@ -339,6 +705,7 @@ class ADBService:
             _LOGGER.error(f"Key enter failed: {e}")
             return False
 
+    @_invalidates("current_app")
     async def key_back(self) -> bool:
         """Send back key."""
         try:
@@ -348,6 +715,7 @@ class ADBService:
             _LOGGER.error(f"Key back failed: {e}")
             return False
 
+    @_invalidates("current_app")
     async def key_home(self) -> bool:
         """Send home key."""
         try:
@@ -357,6 +725,18 @@ class ADBService:
             _LOGGER.error(f"Key home failed: {e}")
             return False
 
+    @_invalidates("current_app", "volume", "powered_on")
+    async def send_keyevents(self, keycodes: List[int]) -> bool:
+        """Send a sequence of key events in a single input invocation."""
+        if not keycodes:
+            return True
+        try:
+            await self.shell_command(f"input keyevent {' '.join(str(code) for code in keycodes)}")
+            return True
+        except Exception as e:
+            _LOGGER.error(f"Send key events failed: {e}")
+            return False
+
     # System Commands
     async def take_screenshot(self, filepath: str) -> bool:
         """Take screenshot and save to filepath."""
@@ -367,6 +747,7 @@ class ADBService:
             _LOGGER.error(f"Screenshot failed: {e}")
             return False
 
+    @_invalidates("brightness")
     async def set_brightness(self, brightness: int) -> bool:
         """Set screen brightness (0-255)."""
         try:
@@ -376,6 +757,7 @@ class ADBService:
             _LOGGER.error(f"Set brightness failed: {e}")
             return False
 
+    @_ttl_cached("brightness")
     async def get_brightness(self) -> Optional[int]:
         """Get current screen brightness."""
         try:
@@ -385,19 +767,28 @@ class ADBService:
             _LOGGER.error(f"Get brightness failed: {e}")
             return None
 
+    @_ttl_cached("wifi_info")
     async def get_wifi_info(self) -> Dict[str, Any]:
         """Get WiFi information."""
         try:
             wifi_info = {"ssid": "Unknown", "ip_address": "Unknown"}
             
+            # Fetch the SSID line and the IP line in one round trip; try wlan0
+            # first, then any other non-loopback interface
+            result = await self.shell_command(
+                "dumpsys wifi | grep 'SSID:' | head -1; "
+                f"echo {_WIFI_SECTION_MARKER}; "
+                "ip addr show wlan0 2>/dev/null | grep 'inet ' | head -1 | grep . || "
+                "ip addr show | grep 'inet ' | grep -v '127.0.0.1' | head -1"
+            )
+            ssid_result, _, ip_result = result.partition(_WIFI_SECTION_MARKER)
+            
             # Get WiFi SSID with better parsing
             try:
-                result = await self.shell_command("dumpsys wifi | grep 'SSID:' | head -1")
-                if "SSID:" in result:
-                    ssid_part = result.split("SSID:")[1].strip()
+                if "SSID:" in ssid_result:
+                    ssid_part = ssid_result.split("SSID:")[1].strip()
                     # Remove quotes and extra formatting
-                    import re
-                    ssid_match = re.search(r'"([^"]+)"', ssid_part)
+                    ssid_match = _SSID_RE.search(ssid_part)
                     if ssid_match:
                         wifi_info["ssid"] = ssid_match.group(1)
                     else:
@@ -407,20 +798,9 @@ class ADBService:
                 _LOGGER.debug(f"SSID extraction failed: {e}")
             
             # Get IP address with multiple interface support
-            try:
-                # Try wlan0 first
-                result = await self.shell_command("ip addr show wlan0 | grep 'inet ' | head -1")
-                if "inet " not in result:
-                    # Try other wireless interfaces
-                    result = await self.shell_command("ip addr show | grep 'inet ' | grep -v '127.0.0.1' | head -1")
-                
-                if "inet " in result:
-                    import re
-                    ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', result)
-                    if ip_match:
-                        wifi_info["ip_address"] = ip_match.group(1)
-            except Exception as e:
-                _LOGGER.debug(f"IP address extraction failed: {e}")
+            ip_match = _INET_RE.search(ip_result)
+            if ip_match:
+                wifi_info["ip_address"] = ip_match.group(1)
             
             return wifi_info
         except Exception as e:
@@ -433,6 +813,8 @@ class ADBService:
             # Using shell reboot allows us to reuse shell_command mechanics
             await self.shell_command("reboot")
             self._connected = False
+            self._connected_cache = None
+            self._invalidate_reads()
             return True
         except Exception as e:
             _LOGGER.error(f"Reboot failed: {e}")
@@ -454,23 +836,31 @@ class ADBService:
             except Exception:
                 current_pkg = None
 
-            raw = await self.shell_command("dumpsys media_session", timeout=8)
+            # Only the lines the parser looks at cross the wire
+            patterns = ["Sessions Stack", "package=", "active", "state=PlaybackState"]
+            if current_pkg:
+                patterns.append(current_pkg)
+            grep_args = " ".join(f"-e {shlex.quote(p)}" for p in patterns)
+            raw = await self.shell_command(f"dumpsys media_session | grep -F {grep_args} || true", timeout=8)
             lines = raw.split("\n")
 
             in_stack = False
             active = False
             # We parse sequentially; once we locate an active session with a
             # PlaybackState line, we extract and return the first match.
-            import re
             # 1) Prefer session block near the current foreground package
             if current_pkg:
                 try:
-                    import re
                     # Search for the line index that mentions the package
-                    pkg_indices = [i for i, ln in enumerate(lines) if current_pkg in ln or re.search(rf"package[= ]{re.escape(current_pkg)}\b", ln)]
+                    pkg_indices = [i for i, ln in enumerate(lines) if current_pkg in ln]
                     for idx in pkg_indices:
-                        # Look ahead within a small window for active flag and PlaybackState
-                        window = lines[idx:idx+30]
+                        # Look ahead within a small window for active flag and PlaybackState,
+                        # stopping where another package's session begins
+                        window = [lines[idx]]
+                        for w in lines[idx+1:idx+30]:
+                            if "package=" in w and current_pkg not in w:
+                                break
+                            window.append(w)
                         active = any("active=true" in w.replace(" ", "") for w in window)
                         if not active:
                             continue
@@ -480,9 +870,9 @@ class ADBService:
                             if "state=PlaybackState" not in w:
                                 continue
                             # Symbolic formats
-                            m_sym_paren = re.search(r"state=([A-Z_]+)\((\d+)\)", w)
-                            m_sym_state = re.search(r"state=STATE_([A-Z_]+)", w)
-                            m_sym_plain = re.search(r"PlaybackState\s*\{\s*state=([A-Z_]+)\b", w)
+                            m_sym_paren = _PLAYBACK_SYM_PAREN_RE.search(w)
+                            m_sym_state = _PLAYBACK_SYM_STATE_RE.search(w)
+                            m_sym_plain = _PLAYBACK_SYM_PLAIN_RE.search(w)
                             if m_sym_paren:
                                 sym = m_sym_paren.group(1).upper()
                             elif m_sym_state:
@@ -490,7 +880,7 @@ class ADBService:
                             elif m_sym_plain:
                                 sym = m_sym_plain.group(1).upper()
                             # Numeric fallback
-                            m_num = re.search(r"state=(\d+)", w)
+                            m_num = _PLAYBACK_NUM_RE.search(w)
                             if m_num:
                                 num = int(m_num.group(1))
                             if sym or num is not None:
@@ -521,9 +911,9 @@ class ADBService:
                 # Only consider PlaybackState lines when active
                 if "state=PlaybackState" in line and active:
                     # Recognize several formats
-                    m_sym_paren = re.search(r"state=([A-Z_]+)\((\d+)\)", line)
-                    m_sym_state = re.search(r"state=STATE_([A-Z_]+)", line)
-                    m_sym_plain = re.search(r"PlaybackState\s*\{\s*state=([A-Z_]+)\b", line)
+                    m_sym_paren = _PLAYBACK_SYM_PAREN_RE.search(line)
+                    m_sym_state = _PLAYBACK_SYM_STATE_RE.search(line)
+                    m_sym_plain = _PLAYBACK_SYM_PLAIN_RE.search(line)
                     symbol = None
                     code = None
                     if m_sym_paren:
@@ -534,7 +924,7 @@ class ADBService:
                     elif m_sym_plain:
                         symbol = m_sym_plain.group(1).upper()
                     else:
-                        m_num = re.search(r"state=(\d+)", line)
+                        m_num = _PLAYBACK_NUM_RE.search(line)
                         if m_num:
                             code = int(m_num.group(1))
                     mapped = self._map_playback_symbol_or_code(symbol, code)
@@ -573,6 +963,7 @@ class ADBService:
             pass
         return None
 
+    @_ttl_cached("current_app")
     async def get_current_app(self) -> Optional[str]:
         """Get current foreground app."""
         try:
@@ -580,9 +971,8 @@ class ADBService:
             result = await self.shell_command("dumpsys activity activities | grep 'ActivityRecord' | head -1")
             if "ActivityRecord" in result:
                 # Extract package name from the output
-                import re
                 # Look for package name pattern (com.example.app format)
-                package_match = re.search(r'([a-zA-Z0-9_.]+)/[a-zA-Z0-9_.]+', result)
+                package_match = _COMPONENT_RE.search(result)
                 if package_match:
                     return package_match.group(1)
                 
@@ -596,8 +986,7 @@ class ADBService:
             try:
                 result = await self.shell_command("dumpsys activity top | grep 'ACTIVITY' | head -1")
                 if "ACTIVITY" in result:
-                    import re
-                    package_match = re.search(r'([a-zA-Z0-9_.]+)/[a-zA-Z0-9_.]+', result)
+                    package_match = _COMPONENT_RE.search(result)
                     if package_match:
                         return package_match.group(1)
             except Exception:
@@ -608,6 +997,7 @@ class ADBService:
             _LOGGER.error(f"Get current app failed: {e}")
             return None
 
+    @_invalidates("current_app")
     async def launch_app(self, package_name: str, activity_name: Optional[str] = None) -> bool:
         """Launch an app."""
         try:
@@ -620,6 +1010,7 @@ class ADBService:
             _LOGGER.error(f"Launch app failed: {e}")
             return False
 
+    @_invalidates("current_app")
     async def force_stop_app(self, package_name: str) -> bool:
         """Force-stop an app by package name."""
         try:
@@ -629,191 +1020,354 @@ class ADBService:
             _LOGGER.error(f"Force stop app failed: {e}")
             return False
 
-    async def get_system_performance(self) -> Dict[str, Any]:
-        """Get system performance metrics from top command."""
+    @_invalidates("current_app")
+    async def restart_app(self, package_name: str) -> bool:
+        """Force-stop and relaunch an app in a single shell invocation."""
+        if not _PACKAGE_NAME_RE.match(package_name):
+            _LOGGER.error(f"Refusing to restart invalid package name: {package_name}")
+            return False
+
+        try:
+            # am force-stop returns once the processes are gone, so no pause is needed
+            await self.shell_command(
+                f"am force-stop {package_name} && "
+                f"monkey -p {package_name} -c android.intent.category.LAUNCHER 1",
+                timeout=30,
+            )
+            return True
+        except Exception as e:
+            _LOGGER.error(f"Restart app failed: {e}")
+            return False
+
+    async def get_system_performance(self, include_process: bool = True) -> Dict[str, Any]:
+        """Get system performance metrics, sharing one sample between concurrent callers.
+
+        Callers that only need the system-wide figures pass ``include_process=False``
+        to skip resolving the busiest process's service name.
+        """
+        task = self._performance_task
+        if task is None:
+            task = asyncio.ensure_future(self._sample_system_performance())
+            self._performance_task = task
+            task.add_done_callback(self._clear_performance_task)
+        # Shield the shared sample so one cancelled caller doesn't abort it for the rest
+        performance = dict(await asyncio.shield(task))
+        
+        # Get service name for highest CPU process if PID is available
+        if include_process and performance["highest_cpu_pid"]:
+            try:
+                service_name = await self._get_service_name_cached(performance["highest_cpu_pid"])
+                performance["highest_cpu_service"] = service_name
+            except Exception as e:
+                _LOGGER.debug(f"Failed to get service name for PID {performance['highest_cpu_pid']}: {e}")
+        return performance
+
+    def _clear_performance_task(self, task: asyncio.Future) -> None:
+        """Forget a finished performance sample so the next call takes a new one."""
+        if self._performance_task is task:
+            self._performance_task = None
+
+    async def _sample_system_performance(self) -> Dict[str, Any]:
+        """Get system performance metrics from /proc deltas, or from top if /proc is unreadable."""
         try:
             # Initialize performance data
-            performance = {
-                "cpu_usage_percent": 0.0,
-                "memory_usage_percent": 0.0,
-                "memory_total_mb": 0,
-                "memory_used_mb": 0,
-                "highest_cpu_process": None,
-                "highest_cpu_pid": None,
-                "highest_cpu_percent": 0.0,
-                "highest_cpu_service": None
-            }
+            performance = dict(_DEFAULT_PERFORMANCE)
             
-            # Get top output
-            result = await self.shell_command("top -d 0.5 -n 1", timeout=5)
-            lines = result.split('\n')
-            
-            # Parse CPU usage - Android device format: "400%cpu  98%user   0%nice 207%sys  79%idle"
-            for line in lines:
-                if "%cpu" in line.lower() and "%user" in line:
-                    import re
-                    # Extract user and sys percentages
-                    user_match = re.search(r'(\d+)%user', line)
-                    sys_match = re.search(r'(\d+)%sys', line)
-                    
-                    if user_match and sys_match:
-                        user_cpu = float(user_match.group(1))
-                        sys_cpu = float(sys_match.group(1))
-                        # This device shows cumulative values for all cores, estimate total cores
-                        total_cores = 4  # Typical for Android devices
-                        total_cpu = (user_cpu + sys_cpu) / total_cores
-                        performance["cpu_usage_percent"] = round(total_cpu, 1)
-                    break
-            
-            # Parse Memory usage - Android format: "Mem:  4006164K total,  3660916K used,   345248K free"
-            for line in lines:
-                if "Mem:" in line and "total" in line:
-                    import re
-                    # Extract memory values in KB
-                    total_match = re.search(r'(\d+)K total', line)
-                    used_match = re.search(r'(\d+)K used', line)
-                    
-                    if total_match and used_match:
-                        total_kb = float(total_match.group(1))
-                        used_kb = float(used_match.group(1))
-                        total_mb = round(total_kb / 1024, 1)
-                        used_mb = round(used_kb / 1024, 1)
-                        usage_percent = round((used_kb / total_kb) * 100, 1)
-                        
-                        performance["memory_total_mb"] = total_mb
-                        performance["memory_used_mb"] = used_mb
-                        performance["memory_usage_percent"] = usage_percent
-                    break
-            
-            # Parse highest CPU process from process list
-            process_started = False
-            for line in lines:
-                # Skip header lines until we reach the process list
-                if "PID USER" in line and "%CPU" in line:
-                    process_started = True
-                    continue
-                
-                if process_started and line.strip():
-                    import re
-                    # Clean ANSI escape sequences
-                    clean_line = re.sub(r'\x1B\[[0-9;]*[A-Za-z]', '', line)
-                    parts = clean_line.split()
-                    
-                    if len(parts) >= 11:
-                        try:
-                            pid = parts[0]
-                            cpu_str = parts[8]  # %CPU column (after S column)
-                            command = parts[-1] if len(parts) > 10 else "unknown"
-                            
-                            # Handle CPU percentage
-                            cpu_percent = 0.0
-                            if cpu_str.replace('.', '').isdigit():
-                                cpu_percent = float(cpu_str)
-                            
-                            if cpu_percent > performance["highest_cpu_percent"]:
-                                performance["highest_cpu_pid"] = pid
-                                performance["highest_cpu_percent"] = round(cpu_percent, 1)
-                                performance["highest_cpu_process"] = command
-                            
-                            # Only check first few processes (they are sorted by CPU usage)
-                            if performance["highest_cpu_percent"] > 0:
-                                break
-                                
-                        except (ValueError, IndexError):
-                            continue
+            sample = await self._try_read_proc_sample()
+            previous = self._proc_sample
+            if sample is not None and previous is None:
+                # No baseline yet; measure over a short window, as top itself does
+                await asyncio.sleep(_PROC_BASELINE_WINDOW)
+                previous, sample = sample, await self._try_read_proc_sample()
+            self._proc_sample = sample
             
-            # Get service name for highest CPU process if PID is available
-            if performance["highest_cpu_pid"]:
-                try:
-                    service_name = await self._get_service_name_by_pid(performance["highest_cpu_pid"])
-                    performance["highest_cpu_service"] = service_name
-                except Exception as e:
-                    _LOGGER.debug(f"Failed to get service name for PID {performance['highest_cpu_pid']}: {e}")
+            if sample is not None and previous is not None and sample.total > previous.total:
+                self._apply_proc_delta(performance, previous, sample)
+            else:
+                result = await self.shell_command(f"top -d 0.5 -n 1 -m {_TOP_MAX_ROWS}", timeout=5)
+                self._apply_top_output(performance, result)
             
             return performance
             
         except Exception as e:
             _LOGGER.error(f"Get system performance failed: {e}")
-            return {
-                "cpu_usage_percent": 0.0,
-                "memory_usage_percent": 0.0,
-                "memory_total_mb": 0,
-                "memory_used_mb": 0,
-                "highest_cpu_process": None,
-                "highest_cpu_pid": None,
-                "highest_cpu_percent": 0.0,
-                "highest_cpu_service": None
-            }
+            return dict(_DEFAULT_PERFORMANCE)
+
+    async def _try_read_proc_sample(self) -> Optional["_ProcSample"]:
+        """Read a /proc sample, returning None if the device doesn't allow it."""
+        try:
+            return await self._read_proc_sample()
+        except Exception as e:
+            _LOGGER.debug(f"Reading /proc sample failed: {e}")
+            return None
+
+    async def _read_proc_sample(self) -> Optional["_ProcSample"]:
+        """Read CPU, memory and per-process jiffies from the device's /proc in one call."""
+        result = await self.shell_command(
+            f"grep -hE '{_PROC_SYSTEM_FIELDS}' /proc/stat /proc/meminfo; echo {_PROC_SECTION_MARKER}; "
+            "cat /proc/[0-9]*/stat 2>/dev/null; true",
+            timeout=5,
+        )
+        system, _, process_stats = result.partition(_PROC_SECTION_MARKER)
+        
+        total = idle = cores = 0
+        memory = {key: int(value) for key, value in _MEMINFO_RE.findall(system)}
+        for line in system.split('\n'):
+            parts = line.split()
+            if not parts:
+                continue
+            key = parts[0]
+            if key == "cpu":
+                # user nice system idle iowait irq softirq steal; guest time is already in user
+                values = [int(v) for v in parts[1:9]]
+                total = sum(values)
+                idle = values[3] + (values[4] if len(values) > 4 else 0)
+            elif key.startswith("cpu") and key[3:].isdigit():
+                cores += 1
+        if not total:
+            return None
+        
+        processes: Dict[str, Tuple[str, int, int]] = {}
+        for line in process_stats.split('\n'):
+            # pid (comm) state ppid ...; comm may contain spaces or parentheses
+            head, sep, tail = line.rpartition(')')
+            if not sep:
+                continue
+            pid, _, comm = head.partition(' (')
+            # Only split as far as starttime; the remaining ~30 fields are never used
+            fields = tail.split(None, 20)
+            if len(fields) < 20 or not pid.strip().isdigit():
+                continue
+            # utime and stime are stat fields 14 and 15, starttime is field 22
+            processes[pid.strip()] = (comm, int(fields[11]) + int(fields[12]), int(fields[19]))
+        
+        return _ProcSample(total, idle, max(cores, 1), memory, processes)
+
+    def _apply_proc_delta(self, performance: Dict[str, Any], previous: "_ProcSample", sample: "_ProcSample") -> None:
+        """Fill performance data from the jiffy deltas between two /proc samples."""
+        elapsed = sample.total - previous.total
+        busy = elapsed - (sample.idle - previous.idle)
+        performance["cpu_usage_percent"] = round(max(0.0, busy / elapsed * 100), 1)
+        
+        memory = sample.memory
+        total_kb = memory.get("MemTotal", 0)
+        if total_kb:
+            # Match top's "used" figure, which counts everything not free
+            used_kb = total_kb - memory.get("MemFree", 0)
+            performance["memory_total_mb"] = round(total_kb / 1024, 1)
+            performance["memory_used_mb"] = round(used_kb / 1024, 1)
+            performance["memory_usage_percent"] = round(used_kb / total_kb * 100, 1)
+        
+        # Per-process usage in top's convention, where one fully busy core is 100%
+        busiest_pid, busiest_delta = None, 0
+        for pid, (comm, jiffies, starttime) in sample.processes.items():
+            before = previous.processes.get(pid)
+            # A changed start time means the PID was reused; count the new process from zero
+            delta = jiffies - before[1] if before and before[2] == starttime else jiffies
+            # Most processes are idle between samples; reject them on the integer delta
+            if delta > busiest_delta:
+                busiest_pid, busiest_delta = pid, delta
+        
+        if busiest_pid is not None:
+            per_core = elapsed / sample.cores
+            performance["highest_cpu_pid"] = busiest_pid
+            performance["highest_cpu_percent"] = round(busiest_delta / per_core * 100, 1)
+            performance["highest_cpu_process"] = sample.processes[busiest_pid][0]
+
+    def _apply_top_output(self, performance: Dict[str, Any], result: str) -> None:
+        """Fill performance data from one snapshot of top output."""
+        # Parse CPU usage - Android device format: "400%cpu  98%user   0%nice 207%sys  79%idle"
+        cpu_match = _TOP_CPU_RE.search(result)
+        if cpu_match:
+            user_cpu = float(cpu_match.group(2))
+            sys_cpu = float(cpu_match.group(3))
+            # Values are cumulative over all cores; the "%cpu" capacity is 100% per core
+            total_cores = max(int(cpu_match.group(1)) // 100, 1)
+            total_cpu = min((user_cpu + sys_cpu) / total_cores, 100.0)
+            performance["cpu_usage_percent"] = round(total_cpu, 1)
+        
+        # Parse Memory usage - Android format: "Mem:  4006164K total,  3660916K used,   345248K free"
+        mem_match = _TOP_MEM_RE.search(result)
+        if mem_match:
+            # Memory values are in KB
+            total_kb = float(mem_match.group(1))
+            used_kb = float(mem_match.group(2))
+            if total_kb:
+                performance["memory_total_mb"] = round(total_kb / 1024, 1)
+                performance["memory_used_mb"] = round(used_kb / 1024, 1)
+                performance["memory_usage_percent"] = round((used_kb / total_kb) * 100, 1)
+        
+        # Parse highest CPU process from process list; rows are matched by
+        # shape (PID USER PR NI VIRT RES SHR S %CPU %MEM TIME+ ARGS), capturing
+        # only the last ARGS word
+        for match in _TOP_ROW_RE.finditer(_ANSI_ESCAPE_RE.sub('', result)):
+            cpu_percent = float(match.group(2))
+            if cpu_percent > performance["highest_cpu_percent"]:
+                performance["highest_cpu_pid"] = match.group(1)
+                performance["highest_cpu_percent"] = round(cpu_percent, 1)
+                performance["highest_cpu_process"] = match.group(3)
+
+            # Only check first few processes (they are sorted by CPU usage)
+            if performance["highest_cpu_percent"] > 0:
+                break
+
+    async def _get_service_name_cached(self, pid: str) -> Optional[str]:
+        """Get service name by process ID, remembering it for the life of the process."""
+        process = self._proc_sample.processes.get(pid) if self._proc_sample else None
+        if process is None:
+            # Without a start time a reused PID can't be told apart; don't cache
+            return await self._get_service_name_by_pid(pid)
+        if len(process[0]) < _COMM_MAX_LEN:
+            # comm from the stat sample is the full name unless the kernel cut it short
+            return process[0]
+        
+        key = (pid, process[2])
+        if key in self._service_names:
+            # Long-lived busy processes stay at the young end of the LRU
+            self._service_names.move_to_end(key)
+            return self._service_names[key]
+        service_name = await self._get_service_name_by_pid(pid)
+        self._service_names[key] = service_name
+        if len(self._service_names) > _SERVICE_NAME_CACHE_SIZE:
+            # Evict the least recently used entry
+            self._service_names.popitem(last=False)
+        return service_name
 
     async def _get_service_name_by_pid(self, pid: str) -> Optional[str]:
         """Get service name by process ID."""
+        if not pid.isdigit():
+            return None
         try:
-            # Try to get process info from /proc/PID/cmdline
-            result = await self.shell_command(f"cat /proc/{pid}/cmdline")
-            if result and result.strip():
-                # cmdline contains null-separated command line arguments
-                cmdline = result.replace('\x00', ' ').strip()
-                if cmdline:
-                    # Extract the main command/service name
-                    service_name = cmdline.split()[0]
-                    # Get just the filename without path
-                    if '/' in service_name:
-                        service_name = service_name.split('/')[-1]
-                    return service_name
-            
-            # Fallback: try ps command
-            result = await self.shell_command(f"ps -p {pid} -o comm=")
-            if result and result.strip():
-                return result.strip()
+            # Read cmdline with the ps fallback in one shell round trip
+            result = await self.shell_command(
+                f"cat /proc/{pid}/cmdline 2>/dev/null; echo {_PROC_SECTION_MARKER}; "
+                f"ps -p {pid} -o comm= 2>/dev/null; true"
+            )
+            cmdline, _, comm = result.partition(_PROC_SECTION_MARKER)
             
-            # Another fallback: try ps aux
-            result = await self.shell_command(f"ps aux | grep {pid} | grep -v grep | head -1")
-            if result and result.strip():
-                parts = result.split()
-                if len(parts) >= 11:
-                    # The command is usually in the last column
-                    command = parts[10]
-                    if '/' in command:
-                        command = command.split('/')[-1]
-                    return command
+            # cmdline contains null-separated command line arguments
+            cmdline = cmdline.replace('\x00', ' ').strip()
+            if cmdline:
+                # Extract the main command/service name
+                service_name = cmdline.split()[0]
+                # Get just the filename without path
+                return service_name.rsplit('/', 1)[-1]
             
-            return None
+            # Kernel threads have an empty cmdline; fall back to ps
+            return comm.strip() or None
             
         except Exception as e:
             _LOGGER.debug(f"Failed to get service name for PID {pid}: {e}")
             return None
 
     async def kill_process(self, process_id: int) -> bool:
-        """Kill a process by ID."""
+        """Kill a process by ID, escalating to SIGKILL if it ignores SIGTERM."""
         try:
-            await self.shell_command(f"kill {process_id}")
+            pid = int(process_id)
+            # Signal, wait and escalate on the device in one shell round trip;
+            # the process may exit on its own just before the KILL, which is fine
+            await self.shell_command(
+                f"kill -TERM {pid} && {{ sleep 0.5; ! kill -0 {pid} 2>/dev/null || kill -KILL {pid} 2>/dev/null; true; }}"
+            )
             return True
         except Exception as e:
             _LOGGER.error(f"Kill process failed: {e}")
             return False
 
-    # iSG Monitoring Commands
-    async def is_isg_running(self) -> bool:
-        """Check if iSG app is running."""
+    async def _snapshot_processes(self, max_age: float = 2.0) -> Set[str]:
+        """Return the names of all running processes from a single ps pass.
+
+        Each name is stored verbatim and with any ``:subprocess`` suffix
+        stripped, so a package also matches its secondary processes.
+        Snapshots younger than ``max_age`` seconds are shared between callers.
+        """
+        now = time.monotonic()
+        if self._ps_cache is not None and now - self._ps_cache[0] < max_age:
+            return self._ps_cache[1]
+
+        result = await self.shell_command("ps -A -o NAME 2>/dev/null || ps")
+        names: Set[str] = set()
+        for line in result.split('\n'):
+            parts = line.split()
+            if not parts:
+                continue
+            # The process name is the last column in both ps formats
+            name = parts[-1]
+            names.add(name)
+            names.add(name.split(':', 1)[0])
+        self._ps_cache = (now, names)
+        return names
+
+    async def _find_package_processes(self, package_name: str) -> List[List[str]]:
+        """Return the ps rows whose process name belongs to the given package."""
+        result = await self.shell_command("ps -A 2>/dev/null || ps")
+        rows = []
+        for line in result.split('\n'):
+            parts = line.split()
+            # Rows are USER PID ... NAME; the header has a non-numeric PID
+            if len(parts) < 2 or not parts[1].isdigit():
+                continue
+            name = parts[-1]
+            if name == package_name or name.split(':', 1)[0] == package_name:
+                rows.append(parts)
+        return rows
+
+    async def is_package_running(self, package_name: str, max_age: float = 2.0) -> bool:
+        """Check if any process of the given package is running.
+
+        The package counts as running if its main process or any of its
+        ``package:suffix`` secondary processes is, whether or not the device
+        has pidof.
+        """
         try:
-            result = await self.shell_command("ps | grep com.linknlink.app.device.isg | grep -v grep")
-            return bool(result.strip())
+            if self._has_pidof is None:
+                # Probe once; older devices ship a toolbox without pidof
+                result = await self.shell_command("command -v pidof || true")
+                self._has_pidof = bool(result)
+            if self._has_pidof:
+                result = await self.shell_command(f"pidof {package_name} || true", timeout=5)
+                if result:
+                    return True
+                # pidof only matches the main process; secondaries need the ps scan
+            return package_name in await self._snapshot_processes(max_age)
         except Exception as e:
-            _LOGGER.error(f"Check iSG running failed: {e}")
+            _LOGGER.error(f"Check {package_name} running failed: {e}")
             return False
 
+    async def wait_for_package(self, package_name: str, running: bool, timeout: float) -> bool:
+        """Poll until a package reaches the wanted running state or timeout expires."""
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time()
+        deadline = next_poll + timeout
+        while True:
+            if await self.is_package_running(package_name, max_age=0) == running:
+                return True
+            now = loop.time()
+            if now >= deadline:
+                return False
+            # Keep a fixed cadence however long the probe took, and take the
+            # last look exactly at the deadline rather than past it
+            next_poll = max(next_poll + _PACKAGE_POLL_INTERVAL, now)
+            await asyncio.sleep(min(next_poll, deadline) - now)
+
+    # iSG Monitoring Commands
+    async def is_isg_running(self) -> bool:
+        """Check if iSG app is running."""
+        return await self.is_package_running(ISG_PACKAGE)
+
     async def get_isg_process_info(self) -> Dict[str, Any]:
         """Get iSG process information."""
         try:
-            result = await self.shell_command("ps | grep com.linknlink.app.device.isg | grep -v grep")
-            if result.strip():
-                parts = result.strip().split()
-                if len(parts) >= 2:
-                    return {
-                        "pid": int(parts[1]),
-                        "running": True,
-                        "process_info": result.strip()
-                    }
+            if not await self.is_isg_running():
+                # No process of the package is running; skip the full ps scan
+                return {"pid": None, "running": False, "process_info": ""}
+            rows = await self._find_package_processes(ISG_PACKAGE)
+            if rows:
+                return {
+                    "pid": int(rows[0][1]),
+                    "running": True,
+                    "process_info": '\n'.join(' '.join(row) for row in rows)
+                }
             return {"pid": None, "running": False, "process_info": ""}
         except Exception as e:
             _LOGGER.error(f"Get iSG process info failed: {e}")
@@ -829,14 +1383,12 @@ class ADBService:
             
             # Launch iSG app
             _LOGGER.info("iSG is not running, launching...")
-            success = await self.launch_app("com.linknlink.app.device.isg")
+            success = await self.launch_app(ISG_PACKAGE)
             
             if success:
                 _LOGGER.info("iSG launched successfully")
-                # Wait a moment for the app to start
-                await asyncio.sleep(3)
-                # Verify it's running
-                if await self.is_isg_running():
+                # Wait for the app to start
+                if await self.wait_for_package(ISG_PACKAGE, True, 10):
                     _LOGGER.info("iSG is now running")
                     return True
                 else:
@@ -856,32 +1408,26 @@ class ADBService:
             _LOGGER.info("Restarting iSG app...")
             
             # Kill existing iSG processes
-            result = await self.shell_command("ps | grep com.linknlink.app.device.isg | grep -v grep")
-            if result.strip():
-                pids = []
-                for line in result.strip().split('\n'):
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            pids.append(parts[1])
+            rows = await self._find_package_processes(ISG_PACKAGE)
+            if rows:
+                pids = " ".join(row[1] for row in rows)
                 
-                for pid in pids:
-                    try:
-                        await self.shell_command(f"kill {pid}")
-                        _LOGGER.info(f"Killed iSG process {pid}")
-                    except Exception as e:
-                        _LOGGER.warning(f"Failed to kill iSG process {pid}: {e}")
+                # Signal every process in one shell round trip
+                try:
+                    await self.shell_command(f"kill {pids}")
+                    _LOGGER.info(f"Killed iSG processes {pids}")
+                except Exception as e:
+                    _LOGGER.warning(f"Failed to kill iSG processes {pids}: {e}")
             
-            # Wait a moment
-            await asyncio.sleep(2)
+            # Wait for the processes to exit
+            await self.wait_for_package(ISG_PACKAGE, False, 5)
             
             # Launch iSG again
-            success = await self.launch_app("com.linknlink.app.device.isg")
+            success = await self.launch_app(ISG_PACKAGE)
             
             if success:
                 _LOGGER.info("iSG restarted successfully")
-                await asyncio.sleep(3)
-                return await self.is_isg_running()
+                return await self.wait_for_package(ISG_PACKAGE, True, 10)
             else:
                 _LOGGER.error("Failed to restart iSG")
                 return False
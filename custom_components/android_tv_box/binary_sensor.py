@@ -1,4 +1,5 @@
 """Binary Sensor platform for Android TV Box integration."""
+import asyncio
 import logging
 from typing import Any, Dict
 from datetime import timedelta
@@ -9,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .helpers import get_adb_service, get_config
+from .helpers import get_adb_service, get_config, log_throttled
 from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,48 +50,56 @@ class AndroidTVBoxBinarySensorCoordinator(DataUpdateCoordinator):
                 adb_connected = await self.adb_service.is_connected()
                 data["adb_connected"] = adb_connected
             except Exception as e:
-                _LOGGER.warning(f"Failed to check ADB connection: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "binary_sensor: Failed to check ADB connection", f"Failed to check ADB connection: {e}")
                 data["adb_connected"] = False
             
             # Only check other services if ADB is connected
             if data["adb_connected"]:
-                # Check iSG status if monitoring is enabled
+                # The iSG wake-up workflow can take seconds; don't let it
+                # hold back the CPU check
+                checks = [self._update_cpu_warning(data)]
                 if self.isg_monitoring:
-                    try:
-                        isg_running = await self.adb_service.is_isg_running()
-                        data["isg_running"] = isg_running
-                        
-                        if not isg_running:
-                            _LOGGER.warning("iSG is not running, attempting to wake it up...")
-                            try:
-                                wake_success = await self.adb_service.wake_up_isg()
-                                data["isg_wake_attempted"] = wake_success
-                                if wake_success:
-                                    _LOGGER.info("iSG wake up successful")
-                                else:
-                                    _LOGGER.error("iSG wake up failed")
-                            except Exception as e:
-                                _LOGGER.error(f"Failed to wake up iSG: {e}")
-                                data["isg_wake_attempted"] = False
-                        else:
-                            data["isg_wake_attempted"] = False
-                    except Exception as e:
-                        _LOGGER.warning(f"Failed to check iSG status: {e}")
-                
-                # Check system performance for high CPU warning
-                try:
-                    performance = await self.adb_service.get_system_performance()
-                    cpu_usage = performance.get("cpu_usage", 0)
-                    cpu_threshold = self.config.get("cpu_threshold", 50)
-                    data["high_cpu_warning"] = cpu_usage > cpu_threshold
-                except Exception as e:
-                    _LOGGER.debug(f"Failed to get system performance: {e}")
+                    checks.append(self._update_isg_status(data))
+                await asyncio.gather(*checks)
             
             return data
         except Exception as err:
-            _LOGGER.error(f"Error communicating with Android TV Box: {err}")
+            log_throttled(_LOGGER, logging.ERROR, "binary_sensor: Error communicating with Android TV Box", f"Error communicating with Android TV Box: {err}")
             return data  # Return default data instead of raising exception
 
+    async def _update_isg_status(self, data: Dict[str, Any]) -> None:
+        """Check iSG status and wake it up if it is not running."""
+        try:
+            isg_running = await self.adb_service.is_isg_running()
+            data["isg_running"] = isg_running
+            
+            if not isg_running:
+                _LOGGER.warning("iSG is not running, attempting to wake it up...")
+                try:
+                    wake_success = await self.adb_service.wake_up_isg()
+                    data["isg_wake_attempted"] = wake_success
+                    if wake_success:
+                        _LOGGER.info("iSG wake up successful")
+                    else:
+                        _LOGGER.error("iSG wake up failed")
+                except Exception as e:
+                    log_throttled(_LOGGER, logging.ERROR, "binary_sensor: Failed to wake up iSG", f"Failed to wake up iSG: {e}")
+                    data["isg_wake_attempted"] = False
+            else:
+                data["isg_wake_attempted"] = False
+        except Exception as e:
+            log_throttled(_LOGGER, logging.WARNING, "binary_sensor: Failed to check iSG status", f"Failed to check iSG status: {e}")
+
+    async def _update_cpu_warning(self, data: Dict[str, Any]) -> None:
+        """Check system performance for high CPU warning."""
+        try:
+            performance = await self.adb_service.get_system_performance(include_process=False)
+            cpu_usage = performance.get("cpu_usage_percent") or 0
+            cpu_threshold = self.config.get("cpu_threshold", 50)
+            data["high_cpu_warning"] = cpu_usage > cpu_threshold
+        except Exception as e:
+            _LOGGER.debug(f"Failed to get system performance: {e}")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
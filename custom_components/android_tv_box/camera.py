@@ -1,7 +1,9 @@
 """Camera platform for Android TV Box integration."""
 import logging
 import asyncio
+import functools
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -12,7 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import aiohttp
 
-from .helpers import get_adb_service, get_config
+from .helpers import get_adb_service, get_config, log_throttled
 from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,32 +37,33 @@ class AndroidTVBoxCameraCoordinator(DataUpdateCoordinator):
         self.config = config
         self.screenshot_path = config.get("screenshot_path", "/sdcard/isgbackup/screenshot/")
         self.keep_count = config.get("screenshot_keep_count", 3)
-        self._last_screenshot_time = 0
+        self._last_screenshot_time = float("-inf")
+        self._screenshot_interval = config.get("screenshot_interval", 3)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data via library."""
         # Default data structure
-        current_time = datetime.now()
-        data = {"last_update": current_time}
+        data = {"last_update": datetime.now()}
         
         try:
             # Only take screenshot if enough time has passed
-            if current_time.timestamp() - self._last_screenshot_time >= self.config.get("screenshot_interval", 3):
+            current_time = time.monotonic()
+            if current_time - self._last_screenshot_time >= self._screenshot_interval:
                 try:
                     await self._take_screenshot()
-                    self._last_screenshot_time = current_time.timestamp()
+                    self._last_screenshot_time = current_time
                 except Exception as e:
-                    _LOGGER.warning(f"Failed to take screenshot: {e}")
+                    log_throttled(_LOGGER, logging.WARNING, "camera: Failed to take screenshot", f"Failed to take screenshot: {e}")
             
             # Clean up old screenshots
             try:
                 await self._cleanup_screenshots()
             except Exception as e:
-                _LOGGER.warning(f"Failed to cleanup screenshots: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "camera: Failed to cleanup screenshots", f"Failed to cleanup screenshots: {e}")
             
             return data
         except Exception as err:
-            _LOGGER.error(f"Error communicating with Android TV Box: {err}")
+            log_throttled(_LOGGER, logging.ERROR, "camera: Error communicating with Android TV Box", f"Error communicating with Android TV Box: {err}")
             return data  # Return default data instead of raising exception
 
     async def _take_screenshot(self) -> None:
@@ -135,7 +138,9 @@ class AndroidTVBoxCameraCoordinator(DataUpdateCoordinator):
             
             # Create temp directory if it doesn't exist
             temp_dir = "/tmp/android_tv_screenshots"
-            os.makedirs(temp_dir, exist_ok=True)
+            await self.hass.async_add_executor_job(
+                functools.partial(os.makedirs, temp_dir, exist_ok=True)
+            )
             
             # Pull the file from device to local temp location
             temp_file = f"{temp_dir}/screenshot_{datetime.now().timestamp()}.png"
@@ -147,29 +152,36 @@ class AndroidTVBoxCameraCoordinator(DataUpdateCoordinator):
                 _LOGGER.error(f"Failed to pull screenshot {latest_file}: {err}")
                 return None
 
-            if os.path.exists(temp_file):
-                try:
-                    with open(temp_file, 'rb') as f:
-                        data = f.read()
-                    
-                    # Validate that we got a valid image
-                    if len(data) > 100:  # Basic check for non-empty file
-                        return data
-                    else:
-                        _LOGGER.warning(f"Screenshot file too small: {len(data)} bytes")
-                        return None
-                finally:
-                    # Always clean up temp file
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-            else:
+            data = await self.hass.async_add_executor_job(self._read_temp_file, temp_file)
+            if data is None:
                 _LOGGER.error(f"Screenshot file missing after pull: {latest_file}")
                 return None
-                
+
+            # Validate that we got a valid image
+            if len(data) > 100:  # Basic check for non-empty file
+                return data
+            _LOGGER.warning(f"Screenshot file too small: {len(data)} bytes")
+            return None
+
         except Exception as e:
             _LOGGER.error(f"Get screenshot error: {e}")
             return None
 
+    @staticmethod
+    def _read_temp_file(path: str) -> Optional[bytes]:
+        """Read and remove a pulled screenshot; runs in the executor."""
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        finally:
+            # Always clean up temp file
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -1,11 +1,18 @@
 """Helper functions for Android TV Box integration."""
-from typing import Dict, Any, Optional
+import logging
+import time
+from typing import Dict, Any, List, Optional
 
 from homeassistant.core import HomeAssistant
 
 from .adb_service import ADBService
 from .config import DOMAIN
 
+LOG_THROTTLE_INTERVAL = 60
+
+# key -> [time of last emitted message, messages suppressed since]
+_log_throttle: Dict[str, List[float]] = {}
+
 
 def get_adb_service(hass: HomeAssistant) -> Optional[ADBService]:
     """Get the ADB service instance."""
@@ -32,3 +39,17 @@ def set_config(hass: HomeAssistant, config: Dict[str, Any]) -> None:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
     hass.data[DOMAIN]["config"] = config
+
+
+def log_throttled(logger: logging.Logger, level: int, key: str, msg: str) -> None:
+    """Log a message at most once per LOG_THROTTLE_INTERVAL for the given key."""
+    now = time.monotonic()
+    entry = _log_throttle.get(key)
+    if entry is not None and now - entry[0] < LOG_THROTTLE_INTERVAL:
+        entry[1] += 1
+        return
+
+    if entry is not None and entry[1]:
+        msg = f"{msg} ({int(entry[1])} similar messages suppressed)"
+    _log_throttle[key] = [now, 0]
+    logger.log(level, msg)
@@ -14,7 +14,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .helpers import get_adb_service, get_config
+from .helpers import get_adb_service, get_config, log_throttled
 from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
@@ -57,21 +57,21 @@ class AndroidTVBoxCoordinator(DataUpdateCoordinator):
                     data["volume_level"] = 0.5
                     data["is_volume_muted"] = False
             except Exception as e:
-                _LOGGER.warning(f"Failed to get volume: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "media_player: Failed to get volume", f"Failed to get volume: {e}")
             
             # Check if device is powered on
             try:
                 is_on = await self.adb_service.is_powered_on()
                 data["is_on"] = is_on
             except Exception as e:
-                _LOGGER.warning(f"Failed to get power status: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "media_player: Failed to get power status", f"Failed to get power status: {e}")
             
             # Get current app
             try:
                 current_app = await self.adb_service.get_current_app()
                 data["current_app"] = current_app if current_app else "Unknown"
             except Exception as e:
-                _LOGGER.warning(f"Failed to get current app: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "media_player: Failed to get current app", f"Failed to get current app: {e}")
             
             # Determine media state using media_session when possible
             try:
@@ -91,7 +91,7 @@ class AndroidTVBoxCoordinator(DataUpdateCoordinator):
             
             return data
         except Exception as err:
-            _LOGGER.error(f"Error communicating with Android TV Box: {err}")
+            log_throttled(_LOGGER, logging.ERROR, "media_player: Error communicating with Android TV Box", f"Error communicating with Android TV Box: {err}")
             return data  # Return default data instead of raising exception
 
 
@@ -1,8 +1,15 @@
 """Remote platform for Android TV Box integration."""
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
-from homeassistant.components.remote import RemoteEntity
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    ATTR_NUM_REPEATS,
+    DEFAULT_DELAY_SECS,
+    RemoteEntity,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -12,6 +19,28 @@ from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
 
+# Android key codes for the supported remote commands
+KEY_CODES = MappingProxyType({
+    "up": 19,
+    "down": 20,
+    "left": 21,
+    "right": 22,
+    "enter": 23,
+    "ok": 23,
+    "back": 4,
+    "home": 82,
+    "play": 126,
+    "pause": 127,
+    "stop": 86,
+    "next": 87,
+    "previous": 88,
+    "volume_up": 24,
+    "volume_down": 25,
+    "volume_mute": 164,
+    "power_on": 224,
+    "power_off": 26,
+})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -67,40 +96,36 @@ class AndroidTVBoxRemote(RemoteEntity):
 
     async def async_send_command(self, command: List[str], **kwargs: Any) -> None:
         """Send a command to the device."""
+        num_repeats = kwargs.get(ATTR_NUM_REPEATS, 1)
+        delay_secs = kwargs.get(ATTR_DELAY_SECS, DEFAULT_DELAY_SECS)
+
+        keycodes = []
         for cmd in command:
-            await self._send_key_command(cmd)
-
-    async def _send_key_command(self, command: str) -> None:
-        """Send a key command to the device."""
-        command_map = {
-            "up": self.adb_service.key_up,
-            "down": self.adb_service.key_down,
-            "left": self.adb_service.key_left,
-            "right": self.adb_service.key_right,
-            "enter": self.adb_service.key_enter,
-            "ok": self.adb_service.key_enter,
-            "back": self.adb_service.key_back,
-            "home": self.adb_service.key_home,
-            "play": self.adb_service.media_play,
-            "pause": self.adb_service.media_pause,
-            "stop": self.adb_service.media_stop,
-            "next": self.adb_service.media_next,
-            "previous": self.adb_service.media_previous,
-            "volume_up": self.adb_service.volume_up,
-            "volume_down": self.adb_service.volume_down,
-            "volume_mute": self.adb_service.volume_mute,
-            "power_on": self.adb_service.power_on,
-            "power_off": self.adb_service.power_off,
-        }
-        
-        if command in command_map:
-            try:
-                await command_map[command]()
-                _LOGGER.debug(f"Sent command: {command}")
-            except Exception as e:
-                _LOGGER.error(f"Failed to send command {command}: {e}")
+            keycode = KEY_CODES.get(cmd)
+            if keycode is None:
+                _LOGGER.warning(f"Unknown command: {cmd}")
+            else:
+                keycodes.append(keycode)
+        if not keycodes:
+            return
+
+        if delay_secs <= 0:
+            # No pacing requested; send the whole burst in one input call
+            await self._send_keycodes(command, keycodes * num_repeats)
+            return
+
+        for i in range(num_repeats):
+            for j, keycode in enumerate(keycodes):
+                if i or j:
+                    await asyncio.sleep(delay_secs)
+                await self._send_keycodes(command, [keycode])
+
+    async def _send_keycodes(self, command: List[str], keycodes: List[int]) -> None:
+        """Send key codes to the device."""
+        if await self.adb_service.send_keyevents(keycodes):
+            _LOGGER.debug(f"Sent command: {command}")
         else:
-            _LOGGER.warning(f"Unknown command: {command}")
+            _LOGGER.error(f"Failed to send command {command}")
 
     @property
     def available(self) -> bool:
@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .helpers import get_adb_service, get_config
+from .helpers import get_adb_service, get_config, log_throttled
 from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +32,19 @@ class AndroidTVBoxSelectCoordinator(DataUpdateCoordinator):
         self.config = config
         self.apps = config.get("apps", {})
         self.visible_apps = config.get("visible", [])
+        # Reverse lookup from package name to app name, rebuilt when the web UI edits apps
+        self._app_names: Dict[str, str] = {}
+        self._app_names_key: Optional[tuple] = None
+
+    def app_name_for(self, package_name: Optional[str]) -> Optional[str]:
+        """Return the configured app name for a package; the first configured name wins."""
+        key = tuple(self.apps.items())
+        if key != self._app_names_key:
+            self._app_names = {}
+            for app_name, package in self.apps.items():
+                self._app_names.setdefault(package, app_name)
+            self._app_names_key = key
+        return self._app_names.get(package_name)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data via library."""
@@ -48,19 +61,13 @@ class AndroidTVBoxSelectCoordinator(DataUpdateCoordinator):
                 data["current_app"] = current_app
                 
                 # Find current app name from package name
-                current_app_name = None
-                for app_name, package_name in self.apps.items():
-                    if package_name == current_app:
-                        current_app_name = app_name
-                        break
-                
-                data["current_app_name"] = current_app_name
+                data["current_app_name"] = self.app_name_for(current_app)
             except Exception as e:
-                _LOGGER.warning(f"Failed to get current app: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "select: Failed to get current app", f"Failed to get current app: {e}")
             
             return data
         except Exception as err:
-            _LOGGER.error(f"Error communicating with Android TV Box: {err}")
+            log_throttled(_LOGGER, logging.ERROR, "select: Error communicating with Android TV Box", f"Error communicating with Android TV Box: {err}")
             return data  # Return default data instead of raising exception
 
 
@@ -115,15 +122,12 @@ class AndroidTVBoxAppSelect(SelectEntity):
     @property
     def options(self) -> List[str]:
         """Return a list of available options."""
+        # Built on read: the web UI edits the app lists in place
         if self.visible_apps:
-            # Return only visible apps
-            options = [app for app in self.visible_apps if app in self.apps]
-        else:
-            # Return all configured apps
-            options = list(self.apps.keys())
-        
-        _LOGGER.info(f"Select options: {options}")
-        return options
+            # Only visible apps
+            return [app for app in self.visible_apps if app in self.apps]
+        # All configured apps
+        return list(self.apps.keys())
 
     @property
     def current_option(self) -> Optional[str]:
@@ -136,10 +140,10 @@ class AndroidTVBoxAppSelect(SelectEntity):
             return None
         
         # Find app name from package name
-        for app_name, package_name in self.apps.items():
-            if package_name == current_app:
-                _LOGGER.info(f"Current app: {app_name} ({package_name})")
-                return app_name
+        app_name = self.coordinator.app_name_for(current_app)
+        if app_name is not None:
+            _LOGGER.info(f"Current app: {app_name} ({current_app})")
+            return app_name
         
         _LOGGER.warning(f"Unknown app package: {current_app}")
         return None
@@ -1,6 +1,8 @@
 """Sensor platform for Android TV Box integration."""
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 from datetime import timedelta
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
@@ -10,12 +12,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 
-from .helpers import get_adb_service, get_config
+from .helpers import get_adb_service, get_config, log_throttled
 from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=10)
+PERFORMANCE_INTERVAL_MAX = 60  # seconds between performance samples while idle
 
 
 class AndroidTVBoxSensorCoordinator(DataUpdateCoordinator):
@@ -33,6 +36,9 @@ class AndroidTVBoxSensorCoordinator(DataUpdateCoordinator):
         self.config = config
         self.cpu_threshold = config.get("cpu_threshold", 50)
         self._high_cpu_count = 0
+        # (monotonic time the next sample is due, last performance sample)
+        self._performance: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._performance_interval = SCAN_INTERVAL.total_seconds()
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data via library."""
@@ -49,30 +55,37 @@ class AndroidTVBoxSensorCoordinator(DataUpdateCoordinator):
         }
         
         try:
+            # The probes are independent, so run them concurrently
+            brightness, wifi_info, current_app, performance = await asyncio.gather(
+                self.adb_service.get_brightness(),
+                self.adb_service.get_wifi_info(),
+                self.adb_service.get_current_app(),
+                self._get_performance(),
+                return_exceptions=True,
+            )
+            
             # Get brightness
-            try:
-                brightness = await self.adb_service.get_brightness()
+            if isinstance(brightness, Exception):
+                log_throttled(_LOGGER, logging.WARNING, "sensor: Failed to get brightness", f"Failed to get brightness: {brightness}")
+            else:
                 data["brightness"] = brightness
-            except Exception as e:
-                _LOGGER.warning(f"Failed to get brightness: {e}")
             
             # Get WiFi info
-            try:
-                wifi_info = await self.adb_service.get_wifi_info()
+            if isinstance(wifi_info, Exception):
+                log_throttled(_LOGGER, logging.WARNING, "sensor: Failed to get WiFi info", f"Failed to get WiFi info: {wifi_info}")
+            else:
                 data.update(wifi_info)
-            except Exception as e:
-                _LOGGER.warning(f"Failed to get WiFi info: {e}")
             
             # Get current app
-            try:
-                current_app = await self.adb_service.get_current_app()
+            if isinstance(current_app, Exception):
+                log_throttled(_LOGGER, logging.WARNING, "sensor: Failed to get current app", f"Failed to get current app: {current_app}")
+            else:
                 data["current_app"] = current_app
-            except Exception as e:
-                _LOGGER.warning(f"Failed to get current app: {e}")
             
             # Get system performance
-            try:
-                performance = await self.adb_service.get_system_performance()
+            if isinstance(performance, Exception):
+                log_throttled(_LOGGER, logging.WARNING, "sensor: Failed to get system performance", f"Failed to get system performance: {performance}")
+            else:
                 # Normalize keys for sensors
                 # cpu_usage_percent -> cpu_usage
                 if "cpu_usage_percent" in performance:
@@ -89,8 +102,6 @@ class AndroidTVBoxSensorCoordinator(DataUpdateCoordinator):
                     "highest_cpu_percent": performance.get("highest_cpu_percent"),
                     "highest_cpu_service": performance.get("highest_cpu_service"),
                 })
-            except Exception as e:
-                _LOGGER.warning(f"Failed to get system performance: {e}")
             
             # Check for high CPU usage
             cpu_usage = data.get("cpu_usage", 0)
@@ -107,9 +118,26 @@ class AndroidTVBoxSensorCoordinator(DataUpdateCoordinator):
             
             return data
         except Exception as err:
-            _LOGGER.error(f"Error communicating with Android TV Box: {err}")
+            log_throttled(_LOGGER, logging.ERROR, "sensor: Error communicating with Android TV Box", f"Error communicating with Android TV Box: {err}")
             return data  # Return default data instead of raising exception
 
+    async def _get_performance(self) -> Dict[str, Any]:
+        """Get system performance, sampling less often while the device is idle."""
+        now = time.monotonic()
+        if self._performance is not None and now < self._performance[0]:
+            return self._performance[1]
+        
+        performance = await self.adb_service.get_system_performance()
+        cpu_usage = performance.get("cpu_usage_percent") or 0
+        if cpu_usage > self.cpu_threshold / 2:
+            # Load is building up; sample on every update again
+            self._performance_interval = SCAN_INTERVAL.total_seconds()
+        else:
+            self._performance_interval = min(self._performance_interval * 2, PERFORMANCE_INTERVAL_MAX)
+        # Allow a second of slack so coordinator jitter doesn't skip a due sample
+        self._performance = (now + self._performance_interval - 1, performance)
+        return performance
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
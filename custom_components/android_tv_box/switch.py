@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import asyncio
 
-from .helpers import get_adb_service, get_config
+from .helpers import get_adb_service, get_config, log_throttled
 from .adb_service import ADBService
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,25 +46,25 @@ class AndroidTVBoxSwitchCoordinator(DataUpdateCoordinator):
                 is_on = await self.adb_service.is_powered_on()
                 data["power_on"] = is_on
             except Exception as e:
-                _LOGGER.warning(f"Failed to get power status: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "switch: Failed to get power status", f"Failed to get power status: {e}")
             
             # Check WiFi status
             try:
                 wifi_on = await self.adb_service.is_wifi_on()
                 data["wifi_on"] = wifi_on
             except Exception as e:
-                _LOGGER.warning(f"Failed to get WiFi status: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "switch: Failed to get WiFi status", f"Failed to get WiFi status: {e}")
             
             # Check ADB connection status
             try:
                 adb_connected = await self.adb_service.is_connected()
                 data["adb_connected"] = adb_connected
             except Exception as e:
-                _LOGGER.warning(f"Failed to get ADB connection status: {e}")
+                log_throttled(_LOGGER, logging.WARNING, "switch: Failed to get ADB connection status", f"Failed to get ADB connection status: {e}")
             
             return data
         except Exception as err:
-            _LOGGER.error(f"Error communicating with Android TV Box: {err}")
+            log_throttled(_LOGGER, logging.ERROR, "switch: Error communicating with Android TV Box", f"Error communicating with Android TV Box: {err}")
             return data  # Return default data instead of raising exception
 
 
@@ -12,7 +12,7 @@ import aiohttp_cors
 
 from . import DOMAIN
 from .helpers import get_adb_service, get_config, set_config
-from .adb_service import ADBService
+from .adb_service import ADBService, ISG_PACKAGE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +27,13 @@ class AndroidTVBoxWebServer:
         self.runner = None
         self.site = None
         self._config_file = None
+        # (loop time collected, status) of the last device status snapshot
+        self._status_cache = None
+        self._status_ttl = 5
+        # In-flight refresh shared by concurrent requests once the snapshot expires
+        self._status_task: Optional[asyncio.Future] = None
+        # The bundled page only changes with the integration itself
+        self._index_html: Optional[str] = None
 
     async def start(self) -> bool:
         """Start the web server."""
@@ -103,10 +110,11 @@ class AndroidTVBoxWebServer:
     async def _serve_index(self, request: Request) -> Response:
         """Serve the main index.html file."""
         try:
-            index_path = os.path.join(os.path.dirname(__file__), 'web', 'index.html')
-            loop = asyncio.get_event_loop()
-            content = await loop.run_in_executor(None, self._read_file_sync, index_path)
-            return web.Response(text=content, content_type='text/html')
+            if self._index_html is None:
+                index_path = os.path.join(os.path.dirname(__file__), 'web', 'index.html')
+                loop = asyncio.get_event_loop()
+                self._index_html = await loop.run_in_executor(None, self._read_file_sync, index_path)
+            return web.Response(text=self._index_html, content_type='text/html')
         except Exception as e:
             _LOGGER.error(f"Error serving index: {e}")
             return web.Response(text="Error loading page", status=500)
@@ -134,6 +142,11 @@ class AndroidTVBoxWebServer:
         with open(file_path, 'r', encoding='utf-8') as f:
             return f.read()
 
+    def _write_json_sync(self, file_path: str, data: Dict[str, Any]) -> None:
+        """Write JSON file synchronously for use in executor."""
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
     async def _get_config(self, request: Request) -> Response:
         """Get current configuration."""
         try:
@@ -424,77 +437,22 @@ class AndroidTVBoxWebServer:
             }, status=500)
 
     async def _get_status(self, request: Request) -> Response:
-        """Get system status."""
+        """Get system status, reusing a snapshot younger than the status TTL."""
         try:
-            adb_service = get_adb_service(self.hass)
-            config = get_config(self.hass)
-            
-            status = {
-                "adb_connected": False,
-                "device_powered_on": False,
-                "wifi_enabled": False,
-                "current_app": None,
-                "current_app_name": None,
-                "isg_running": False,
-                "cpu_usage": 0,
-                "memory_used": 0,
-                "brightness": 0,
-                "ssid": "Unknown",
-                "ip_address": "Unknown",
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            if adb_service:
-                try:
-                    status["adb_connected"] = await adb_service.is_connected()
-                    if status["adb_connected"]:
-                        status["device_powered_on"] = await adb_service.is_powered_on()
-                        status["wifi_enabled"] = await adb_service.is_wifi_on()
-                        status["current_app"] = await adb_service.get_current_app()
-                        status["isg_running"] = await adb_service.is_isg_running()
-                        
-                        # Get additional data
-                        try:
-                            brightness = await adb_service.get_brightness()
-                            status["brightness"] = brightness
-                        except Exception as e:
-                            _LOGGER.warning(f"Failed to get brightness: {e}")
-                        
-                        try:
-                            wifi_info = await adb_service.get_wifi_info()
-                            status.update(wifi_info)
-                        except Exception as e:
-                            _LOGGER.warning(f"Failed to get WiFi info: {e}")
-                        
-                        try:
-                            performance = await adb_service.get_system_performance()
-                            status.update(performance)
-                        except Exception as e:
-                            _LOGGER.warning(f"Failed to get system performance: {e}")
-                        
-                        # Find current app name from package name
-                        if status["current_app"] and config:
-                            # Convert to mutable dict if needed
-                            if hasattr(config, '_data'):
-                                config = dict(config._data)
-                            elif not isinstance(config, dict):
-                                config = dict(config)
-                            
-                            apps = config.get("apps", {})
-                            _LOGGER.info(f"Looking for app name for package: {status['current_app']}")
-                            _LOGGER.info(f"Available apps: {apps}")
-                            
-                            for app_name, package_name in apps.items():
-                                if package_name == status["current_app"]:
-                                    status["current_app_name"] = app_name
-                                    _LOGGER.info(f"Found app name: {app_name}")
-                                    break
-                except Exception as e:
-                    _LOGGER.warning(f"Error getting status: {e}")
+            now = self.hass.loop.time()
+            if self._status_cache is None or now - self._status_cache[0] >= self._status_ttl:
+                task = self._status_task
+                if task is None:
+                    task = asyncio.ensure_future(self._refresh_status(now))
+                    self._status_task = task
+                    task.add_done_callback(self._clear_status_task)
+                # Shield the shared refresh so one dropped request doesn't abort it for the rest
+                await asyncio.shield(task)
+            collected, status = self._status_cache
             
             return web.json_response({
                 "success": True,
-                "data": status
+                "data": {**status, "stale_secs": round(now - collected, 1)}
             })
             
         except Exception as e:
@@ -504,6 +462,99 @@ class AndroidTVBoxWebServer:
                 "error": str(e)
             }, status=500)
 
+    async def _refresh_status(self, started: float) -> None:
+        """Collect a status snapshot and cache it as of when collection started."""
+        self._status_cache = (started, await self._collect_status())
+
+    def _clear_status_task(self, task: asyncio.Future) -> None:
+        """Forget a finished status refresh so the next expiry starts a new one."""
+        if self._status_task is task:
+            self._status_task = None
+
+    async def _collect_status(self) -> Dict[str, Any]:
+        """Query the device for a fresh status snapshot."""
+        adb_service = get_adb_service(self.hass)
+        config = get_config(self.hass)
+        
+        status = {
+            "adb_connected": False,
+            "device_powered_on": False,
+            "wifi_enabled": False,
+            "current_app": None,
+            "current_app_name": None,
+            "isg_running": False,
+            "cpu_usage": 0,
+            "memory_used": 0,
+            "brightness": 0,
+            "ssid": "Unknown",
+            "ip_address": "Unknown",
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        if adb_service:
+            try:
+                status["adb_connected"] = await adb_service.is_connected()
+                if status["adb_connected"]:
+                    # The probes are independent, so run them concurrently
+                    (
+                        powered_on, wifi_enabled, current_app, isg_running,
+                        brightness, wifi_info, performance,
+                    ) = await asyncio.gather(
+                        adb_service.is_powered_on(),
+                        adb_service.is_wifi_on(),
+                        adb_service.get_current_app(),
+                        adb_service.is_isg_running(),
+                        adb_service.get_brightness(),
+                        adb_service.get_wifi_info(),
+                        adb_service.get_system_performance(),
+                        return_exceptions=True,
+                    )
+                    for value in (powered_on, wifi_enabled, current_app, isg_running):
+                        if isinstance(value, Exception):
+                            raise value
+                    status["device_powered_on"] = powered_on
+                    status["wifi_enabled"] = wifi_enabled
+                    status["current_app"] = current_app
+                    status["isg_running"] = isg_running
+                    
+                    # Get additional data
+                    if isinstance(brightness, Exception):
+                        _LOGGER.warning(f"Failed to get brightness: {brightness}")
+                    else:
+                        status["brightness"] = brightness
+                    
+                    if isinstance(wifi_info, Exception):
+                        _LOGGER.warning(f"Failed to get WiFi info: {wifi_info}")
+                    else:
+                        status.update(wifi_info)
+                    
+                    if isinstance(performance, Exception):
+                        _LOGGER.warning(f"Failed to get system performance: {performance}")
+                    else:
+                        status.update(performance)
+                    
+                    # Find current app name from package name
+                    if status["current_app"] and config:
+                        # Convert to mutable dict if needed
+                        if hasattr(config, '_data'):
+                            config = dict(config._data)
+                        elif not isinstance(config, dict):
+                            config = dict(config)
+                        
+                        apps = config.get("apps", {})
+                        _LOGGER.info(f"Looking for app name for package: {status['current_app']}")
+                        _LOGGER.info(f"Available apps: {apps}")
+                        
+                        for app_name, package_name in apps.items():
+                            if package_name == status["current_app"]:
+                                status["current_app_name"] = app_name
+                                _LOGGER.info(f"Found app name: {app_name}")
+                                break
+            except Exception as e:
+                _LOGGER.warning(f"Error getting status: {e}")
+        
+        return status
+
     async def _test_connection(self, request: Request) -> Response:
         """Test ADB connection."""
         try:
@@ -616,7 +667,7 @@ class AndroidTVBoxWebServer:
                 }, status=500)
             
             # Wake up iSG by launching it
-            success = await adb_service.launch_app("com.linknlink.app.device.isg")
+            success = await adb_service.launch_app(ISG_PACKAGE)
             
             if success:
                 return web.json_response({
@@ -646,12 +697,8 @@ class AndroidTVBoxWebServer:
                     "error": "ADB service not available"
                 }, status=500)
             
-            # Stop iSG
-            await adb_service.force_stop_app("com.linknlink.app.device.isg")
-            await asyncio.sleep(2)
-            
-            # Start iSG
-            success = await adb_service.launch_app("com.linknlink.app.device.isg")
+            # Stop and start iSG
+            success = await adb_service.restart_app(ISG_PACKAGE)
             
             if success:
                 return web.json_response({
@@ -677,8 +724,8 @@ class AndroidTVBoxWebServer:
             config_dir = self.hass.config.config_dir
             config_file = os.path.join(config_dir, 'android_tv_box_config.json')
             
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._write_json_sync, config_file, config)
                 
             _LOGGER.info(f"Configuration saved to {config_file}")
             
@@ -1,13 +1,31 @@
 #!/usr/bin/env python3
 """Standalone ADB connection test for Android TV Box integration."""
 import asyncio
+import shlex
+import shutil
 import subprocess
 import time
 import logging
+import os
+import re
+from typing import Optional, Sequence
 
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
+BATCH_SEPARATOR = "---SEP---"
+# Stream buffer for adb output; dumpsys can emit hundreds of KB
+STREAM_LIMIT = 1 << 20
+# Seconds to pause between key events; set ADB_TEST_DELAY to watch them on screen
+INTER_KEY_DELAY = float(os.getenv("ADB_TEST_DELAY", "0"))
+# "connected to ..." or "already connected to ..." from adb connect
+_CONNECTED_RE = re.compile(r"\bconnected\b", re.I)
+
+
+def filtered(command: str, pattern: str, limit: int = 20) -> str:
+    """Compose a pipeline that keeps only matching lines, filtered on the device."""
+    return f"{command} | grep -E {shlex.quote(pattern)} | head -n {limit}"
+
 
 class SimpleADBService:
     """Simplified ADB service for testing without Home Assistant dependencies."""
@@ -16,29 +34,43 @@ class SimpleADBService:
         """Initialize ADB service."""
         self.host = host
         self.port = port
-        self.adb_path = adb_path
+        # Resolve adb on PATH once rather than on every spawn
+        self.adb_path = shutil.which(adb_path) or adb_path
         self.device_address = f"{host}:{port}"
+        # argv prefix for "adb shell" on this device, built once
+        self._shell_prefix = ("-s", self.device_address, "shell")
+        # This device's row in "adb devices", in the usable "device" state only
+        self._device_re = re.compile(rf"^{re.escape(self.device_address)}\s+device\b", re.M)
         self._connected = False
+        # Long-lived "adb shell" fed commands over stdin, see shell_command
+        self._shell = None
+        self._shell_lock = asyncio.Lock()
+        self._marker_count = 0
+        # (monotonic time checked, result) of the last "adb devices" query
+        self._devices_cache = (float("-inf"), False)
+        self._devices_ttl = 1.5
+        # command -> (monotonic expiry, output) for probes that do not change mid-run
+        self._shell_cache = {}
 
-    async def _run_command(self, cmd: list, timeout: int = 10) -> str:
+    async def _run_command(self, cmd: Sequence[str], timeout: int = 10) -> str:
         """Run ADB command."""
-        full_cmd = [self.adb_path] + cmd
+        full_cmd = (self.adb_path, *cmd)
         _LOGGER.info(f"Running ADB command: {' '.join(full_cmd)}")
         
         process = await asyncio.create_subprocess_exec(
             *full_cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            # One stream: the error text is in the output and is decoded once
+            stderr=asyncio.subprocess.STDOUT,
+            limit=STREAM_LIMIT
         )
         
         try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
             result = stdout.decode('utf-8', errors='ignore')
             
             if process.returncode != 0:
-                error_msg = stderr.decode('utf-8', errors='ignore')
-                _LOGGER.error(f"ADB command failed: {error_msg}")
-                return error_msg
+                _LOGGER.error(f"ADB command failed: {result}")
             
             return result
         except asyncio.TimeoutError:
@@ -47,10 +79,11 @@ class SimpleADBService:
 
     async def connect(self) -> bool:
         """Connect to ADB device."""
+        self._devices_cache = (float("-inf"), False)
         try:
             # Connect to device
             result = await self._run_command(["connect", self.device_address])
-            if "connected" in result.lower() or "already connected" in result.lower():
+            if _CONNECTED_RE.search(result):
                 self._connected = True
                 _LOGGER.info(f"Connected to Android device at {self.device_address}")
                 return True
@@ -68,45 +101,118 @@ class SimpleADBService:
                 raise Exception("Device not connected")
 
         try:
-            cmd = ["-s", self.device_address, "shell"] + command.split()
-            result = await self._run_command(cmd, timeout=timeout)
+            async with self._shell_lock:
+                result = await self._run_in_shell(command, timeout)
             return result.strip()
         except Exception as e:
             _LOGGER.error(f"ADB command error: {e}")
             raise Exception(f"Command failed: {command}")
 
+    async def shell_cached(self, command: str, ttl: float, timeout: int = 10) -> str:
+        """Execute a read-only shell command, reusing its output for ttl seconds."""
+        now = time.monotonic()
+        cached = self._shell_cache.get(command)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        result = await self.shell_command(command, timeout=timeout)
+        self._shell_cache[command] = (now + ttl, result)
+        return result
+
+    async def _run_in_shell(self, command: str, timeout: int) -> str:
+        """Run a command in the persistent shell, framing its output with an end marker."""
+        if self._shell is None or self._shell.returncode is not None:
+            self._shell = await asyncio.create_subprocess_exec(
+                self.adb_path, *self._shell_prefix,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                # readline() below must hold whole dumpsys lines
+                limit=STREAM_LIMIT
+            )
+        
+        self._marker_count += 1
+        marker = f"__END_{self._marker_count}__"
+        _LOGGER.info(f"Running in ADB shell: {command}")
+        # Start the marker on a fresh line even if the output lacks a trailing newline
+        self._shell.stdin.write(f"{{ {command}\n}} 2>&1 </dev/null; printf '\\n{marker}\\n'\n".encode('utf-8'))
+        await self._shell.stdin.drain()
+        
+        async def read_reply() -> str:
+            lines = []
+            while True:
+                line = await self._shell.stdout.readline()
+                if not line:
+                    raise Exception("ADB shell closed")
+                text = line.decode('utf-8', errors='ignore')
+                if text.rstrip() == marker:
+                    # Drop the newline printed ahead of the marker
+                    return "".join(lines)[:-1]
+                lines.append(text)
+        
+        try:
+            return await asyncio.wait_for(read_reply(), timeout=timeout)
+        except Exception:
+            # A partial reply would desynchronise later commands; start over next time
+            await self._close_shell()
+            raise
+
+    async def _close_shell(self):
+        """Terminate the persistent shell."""
+        shell, self._shell = self._shell, None
+        if shell is not None and shell.returncode is None:
+            shell.kill()
+            await shell.wait()
+
+    async def disconnect(self):
+        """Close the persistent shell."""
+        await self._close_shell()
+        self._connected = False
+
+    async def shell_filtered(self, command: str, pattern: str, limit: int = 20, timeout: int = 10) -> str:
+        """Execute a shell command, returning only the lines that match pattern."""
+        return await self.shell_command(filtered(command, pattern, limit), timeout=timeout)
+
     async def is_connected(self) -> bool:
         """Check if device is connected."""
+        now = time.monotonic()
+        if now - self._devices_cache[0] < self._devices_ttl:
+            return self._devices_cache[1]
         try:
             result = await self._run_command(["devices"])
-            return self.device_address in result and "device" in result
+            connected = bool(self._device_re.search(result))
         except Exception:
-            return False
+            connected = False
+        self._devices_cache = (now, connected)
+        return connected
 
     # Test methods for basic functionality
     async def test_basic_commands(self):
         """Test basic ADB commands."""
         tests = [
-            ("Device property", "getprop ro.product.model"),
             ("Current time", "date"),
             ("WiFi status", "settings get global wifi_on"),
             ("Screen brightness", "settings get system screen_brightness"),
-            ("Battery info", "dumpsys battery | grep level"),
-            ("Current app", "dumpsys activity activities | grep 'ActivityRecord' | head -1"),
+            ("Battery info", filtered("dumpsys battery", "level", 1)),
+            ("Current app", filtered("dumpsys activity activities", "ActivityRecord", 1)),
         ]
         
-        results = {}
-        for test_name, command in tests:
-            try:
-                _LOGGER.info(f"Testing: {test_name}")
-                result = await self.shell_command(command)
-                results[test_name] = result
-                _LOGGER.info(f"  Result: {result}")
-            except Exception as e:
-                _LOGGER.error(f"  Failed: {e}")
-                results[test_name] = f"ERROR: {e}"
+        # The probes are read-only, so run them all in one shell round trip
+        script = f" ; echo {BATCH_SEPARATOR} ; ".join(command for _, command in tests)
+        try:
+            outputs = (await self.shell_command(script)).split(BATCH_SEPARATOR)
+        except Exception as e:
+            outputs = [e] * len(tests)
+        # A probe that produced no chunk at all counts as failed
+        outputs += [Exception("no output")] * (len(tests) - len(outputs))
         
-        return results
+        # The model is fixed for the run; main() has usually fetched it already
+        tests.insert(0, ("Device property", "getprop ro.product.model"))
+        try:
+            outputs.insert(0, await self.shell_cached("getprop ro.product.model", ttl=3600))
+        except Exception as e:
+            outputs.insert(0, e)
+        
+        return self._collect_results(tests, outputs)
 
     async def test_media_commands(self):
         """Test media control commands."""
@@ -124,7 +230,8 @@ class SimpleADBService:
                 result = await self.shell_command(command)
                 results[test_name] = "SUCCESS"
                 _LOGGER.info(f"  Success")
-                await asyncio.sleep(1)  # Small delay between commands
+                if INTER_KEY_DELAY:
+                    await asyncio.sleep(INTER_KEY_DELAY)
             except Exception as e:
                 _LOGGER.error(f"  Failed: {e}")
                 results[test_name] = f"ERROR: {e}"
@@ -135,21 +242,35 @@ class SimpleADBService:
         """Test system information commands."""
         tests = [
             ("CPU info", "top -d 0.5 -n 1 | head -10"),
-            ("Memory info", "cat /proc/meminfo | head -5"),
-            ("WiFi info", "dumpsys wifi | grep 'SSID:' | head -1"),
-            ("Power status", "dumpsys power | grep -E '(mWakefulness|mScreenOn)' | head -2"),
+            ("Memory info", "head -n 5 /proc/meminfo"),
+            ("WiFi info", filtered("dumpsys wifi", "SSID:", 1)),
+            ("Power status", filtered("dumpsys power", "mWakefulness|mScreenOn", 2)),
         ]
         
+        if not self._connected and not await self.connect():
+            return {test_name: "ERROR: Device not connected" for test_name, _ in tests}
+        
+        # The probes are independent and mostly wait on the device (top samples
+        # for 0.5s), so give each its own adb shell and let them overlap
+        outputs = await asyncio.gather(
+            *(self._run_command((*self._shell_prefix, command)) for _, command in tests),
+            return_exceptions=True,
+        )
+        
+        return self._collect_results(tests, outputs, preview=100)
+
+    def _collect_results(self, tests: list, outputs: list, preview: Optional[int] = None) -> dict:
+        """Log each (name, command) test's output, or exception, and tabulate the results."""
         results = {}
-        for test_name, command in tests:
-            try:
-                _LOGGER.info(f"Testing: {test_name}")
-                result = await self.shell_command(command)
-                results[test_name] = result
-                _LOGGER.info(f"  Result: {result[:100]}...")
-            except Exception as e:
-                _LOGGER.error(f"  Failed: {e}")
-                results[test_name] = f"ERROR: {e}"
+        for (test_name, _), output in zip(tests, outputs):
+            _LOGGER.info(f"Testing: {test_name}")
+            if isinstance(output, Exception):
+                _LOGGER.error(f"  Failed: {output}")
+                results[test_name] = f"ERROR: {output}"
+            else:
+                output = output.strip()
+                results[test_name] = output
+                _LOGGER.info(f"  Result: {output if preview is None else output[:preview] + '...'}")
         
         return results
 
@@ -174,6 +295,11 @@ async def main():
     _LOGGER.info("\n2. Checking device status...")
     is_connected = await adb.is_connected()
     _LOGGER.info(f"Device connected: {is_connected}")
+    if is_connected:
+        try:
+            _LOGGER.info(f"Device model: {await adb.shell_cached('getprop ro.product.model', ttl=3600)}")
+        except Exception as e:
+            _LOGGER.warning(f"Could not read device model: {e}")
     
     # Test basic commands
     _LOGGER.info("\n3. Testing basic commands...")
@@ -205,6 +331,8 @@ async def main():
     failed_tests = [name for name, result in all_results.items() if result.startswith("ERROR")]
     if failed_tests:
         _LOGGER.warning(f"Failed tests: {', '.join(failed_tests)}")
+    
+    await adb.disconnect()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 """Complete integration test for Android TV Box Home Assistant integration."""
 import asyncio
+import shutil
 import subprocess
 import time
 import logging
 import json
 import os
+from typing import Sequence
 
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
+# Stream buffer for adb output; dumpsys can emit hundreds of KB
+STREAM_LIMIT = 1 << 20
+
 
 class CompleteIntegrationTest:
     """Complete test suite for Android TV Box integration."""
@@ -18,30 +23,33 @@ class CompleteIntegrationTest:
         """Initialize test suite."""
         self.host = host
         self.port = port
-        self.adb_path = adb_path
+        # Resolve adb on PATH once rather than on every spawn
+        self.adb_path = shutil.which(adb_path) or adb_path
         self.device_address = f"{host}:{port}"
+        # argv prefix for "adb shell" on this device, built once
+        self._shell_prefix = ("-s", self.device_address, "shell")
         self._connected = False
         self.test_results = {}
 
-    async def _run_command(self, cmd: list, timeout: int = 10) -> str:
+    async def _run_command(self, cmd: Sequence[str], timeout: int = 10) -> str:
         """Run ADB command."""
-        full_cmd = [self.adb_path] + cmd
+        full_cmd = (self.adb_path, *cmd)
         _LOGGER.debug(f"Running ADB command: {' '.join(full_cmd)}")
         
         process = await asyncio.create_subprocess_exec(
             *full_cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            # One stream: the error text is in the output and is decoded once
+            stderr=asyncio.subprocess.STDOUT,
+            limit=STREAM_LIMIT
         )
         
         try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
             result = stdout.decode('utf-8', errors='ignore')
             
             if process.returncode != 0:
-                error_msg = stderr.decode('utf-8', errors='ignore')
-                _LOGGER.error(f"ADB command failed: {error_msg}")
-                return error_msg
+                _LOGGER.error(f"ADB command failed: {result}")
             
             return result
         except asyncio.TimeoutError:
@@ -70,7 +78,8 @@ class CompleteIntegrationTest:
                 raise Exception("Device not connected")
 
         try:
-            cmd = ["-s", self.device_address, "shell"] + command.split()
+            # Pass the command whole; the device's shell parses quotes and pipes once
+            cmd = (*self._shell_prefix, command)
             result = await self._run_command(cmd, timeout=timeout)
             return result.strip()
         except Exception as e: